@@ -13,6 +13,7 @@ Design constraints:
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from dataclasses import dataclass
@@ -33,7 +34,7 @@ class CitationAccuracyGateError(ValueError):
 OnFailureAction = Literal["block", "downgrade"]
 
 
-_STOPWORDS: Set[str] = {
+_STOPWORDS: frozenset[str] = frozenset({
     "a",
     "an",
     "and",
@@ -60,7 +61,7 @@ _STOPWORDS: Set[str] = {
     "was",
     "were",
     "with",
-}
+})
 
 
 @dataclass(frozen=True)
@@ -86,47 +87,63 @@ class CitationAccuracyGateConfig:
         if not isinstance(raw, dict):
             return cls()
 
-        enabled = bool(raw.get("enabled", False))
-        on_failure = raw.get("on_failure", "block")
-        if on_failure not in ("block", "downgrade"):
-            on_failure = "block"
-
-        def _as_float(val: Any, default: float) -> float:
-            try:
-                return float(val)
-            except (TypeError, ValueError):
-                return default
-
-        def _as_int(val: Any, default: int) -> int:
-            try:
-                return int(val)
-            except (TypeError, ValueError):
-                return default
-
-        min_alignment_score = _as_float(raw.get("min_alignment_score", cls.min_alignment_score), cls.min_alignment_score)
-        min_keyword_overlap = _as_float(raw.get("min_keyword_overlap", cls.min_keyword_overlap), cls.min_keyword_overlap)
-        enable_entity_overlap = bool(raw.get("enable_entity_overlap", cls.enable_entity_overlap))
-        min_entity_overlap = _as_float(raw.get("min_entity_overlap", cls.min_entity_overlap), cls.min_entity_overlap)
-        enable_numeric_consistency = bool(raw.get("enable_numeric_consistency", cls.enable_numeric_consistency))
-        max_evidence_items_per_claim = _as_int(raw.get("max_evidence_items_per_claim", cls.max_evidence_items_per_claim), cls.max_evidence_items_per_claim)
-
-        # Clamp ranges.
-        min_alignment_score = min(1.0, max(0.0, min_alignment_score))
-        min_keyword_overlap = min(1.0, max(0.0, min_keyword_overlap))
-        min_entity_overlap = min(1.0, max(0.0, min_entity_overlap))
-        if max_evidence_items_per_claim < 1:
-            max_evidence_items_per_claim = 1
-
-        return cls(
-            enabled=enabled,
-            on_failure=on_failure,
-            min_alignment_score=min_alignment_score,
-            min_keyword_overlap=min_keyword_overlap,
-            enable_entity_overlap=enable_entity_overlap,
-            min_entity_overlap=min_entity_overlap,
-            enable_numeric_consistency=enable_numeric_consistency,
-            max_evidence_items_per_claim=max_evidence_items_per_claim,
-        )
+        # Pipelines invoke the gate repeatedly with the same context; memoize
+        # the parse when the raw values are hashable.
+        try:
+            return _cached_config_from_items(tuple(sorted(raw.items())))
+        except TypeError:
+            return _parse_gate_config(raw)
+
+
+def _parse_gate_config(raw: Mapping[str, Any]) -> CitationAccuracyGateConfig:
+    cls = CitationAccuracyGateConfig
+
+    enabled = bool(raw.get("enabled", False))
+    on_failure = raw.get("on_failure", "block")
+    if on_failure not in ("block", "downgrade"):
+        on_failure = "block"
+
+    def _as_float(val: Any, default: float) -> float:
+        try:
+            return float(val)
+        except (TypeError, ValueError):
+            return default
+
+    def _as_int(val: Any, default: int) -> int:
+        try:
+            return int(val)
+        except (TypeError, ValueError):
+            return default
+
+    min_alignment_score = _as_float(raw.get("min_alignment_score", cls.min_alignment_score), cls.min_alignment_score)
+    min_keyword_overlap = _as_float(raw.get("min_keyword_overlap", cls.min_keyword_overlap), cls.min_keyword_overlap)
+    enable_entity_overlap = bool(raw.get("enable_entity_overlap", cls.enable_entity_overlap))
+    min_entity_overlap = _as_float(raw.get("min_entity_overlap", cls.min_entity_overlap), cls.min_entity_overlap)
+    enable_numeric_consistency = bool(raw.get("enable_numeric_consistency", cls.enable_numeric_consistency))
+    max_evidence_items_per_claim = _as_int(raw.get("max_evidence_items_per_claim", cls.max_evidence_items_per_claim), cls.max_evidence_items_per_claim)
+
+    # Clamp ranges.
+    min_alignment_score = min(1.0, max(0.0, min_alignment_score))
+    min_keyword_overlap = min(1.0, max(0.0, min_keyword_overlap))
+    min_entity_overlap = min(1.0, max(0.0, min_entity_overlap))
+    if max_evidence_items_per_claim < 1:
+        max_evidence_items_per_claim = 1
+
+    return cls(
+        enabled=enabled,
+        on_failure=on_failure,
+        min_alignment_score=min_alignment_score,
+        min_keyword_overlap=min_keyword_overlap,
+        enable_entity_overlap=enable_entity_overlap,
+        min_entity_overlap=min_entity_overlap,
+        enable_numeric_consistency=enable_numeric_consistency,
+        max_evidence_items_per_claim=max_evidence_items_per_claim,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_config_from_items(items: Tuple[Tuple[str, Any], ...]) -> CitationAccuracyGateConfig:
+    return _parse_gate_config(dict(items))
 
 
 def _load_json_list(path: Path) -> Tuple[List[Any], Optional[str]]:
@@ -145,7 +162,8 @@ def _load_json_list(path: Path) -> Tuple[List[Any], Optional[str]]:
     return payload, None
 
 
-def _tokenize(text: str) -> Set[str]:
+@functools.lru_cache(maxsize=4096)
+def _tokenize(text: str) -> frozenset[str]:
     tokens: set[str] = set()
     for raw in re.findall(r"[A-Za-z0-9]+", text.lower()):
         if len(raw) < 3:
@@ -156,55 +174,55 @@ def _tokenize(text: str) -> Set[str]:
         if raw in _STOPWORDS:
             continue
         tokens.add(raw)
-    return tokens
+    return frozenset(tokens)
 
 
-def _extract_named_entities(text: str) -> Set[str]:
+@functools.lru_cache(maxsize=4096)
+def _extract_named_entities(text: str) -> frozenset[str]:
     # Heuristic: capture capitalized words and all-caps tokens.
     ents: set[str] = set()
     for m in re.findall(r"\b(?:[A-Z][a-zA-Z]{2,}|[A-Z]{2,})\b", text):
         ents.add(m.lower())
-    return ents
+    return frozenset(ents)
 
 
-def _extract_numbers(text: str) -> Set[str]:
-    # Capture integers, decimals, and percents.
-    nums: set[str] = set()
-    for m in re.findall(r"\b\d+(?:\.\d+)?%?\b", text):
-        nums.add(m)
-    return nums
+# Capture integers, decimals, and percents.
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?%?\b")
 
+# Same as _NUMBER_RE, but the negative lookahead excludes year-like integers
+# (1900-2100) during extraction so they do not dominate numeric checks.
+# Decimals and percents are always kept.
+_NUMBER_RE_FILTERED = re.compile(r"\b(?:\d+\.\d+%?|\d+%|(?!(?:19\d\d|20\d\d|2100)\b)\d+)\b")
 
-def _filter_year_like_numbers(nums: Set[str]) -> Set[str]:
-    """Remove year-like integers (1900-2100) so they do not dominate numeric checks."""
 
-    out: set[str] = set()
-    for n in nums:
-        if n.endswith("%"):
-            out.add(n)
-            continue
-
-        if n.isdigit() and len(n) == 4:
-            try:
-                iv = int(n)
-            except ValueError:
-                out.add(n)
-                continue
-            if 1900 <= iv <= 2100:
-                continue
+@functools.lru_cache(maxsize=4096)
+def _extract_numbers(text: str, *, exclude_years: bool = False) -> frozenset[str]:
+    pattern = _NUMBER_RE_FILTERED if exclude_years else _NUMBER_RE
+    return frozenset(pattern.findall(text))
 
-        out.add(n)
-    return out
 
+def _jaccard_bits(a: int, b: int) -> float:
+    """Jaccard similarity over two bitmask-encoded token sets."""
 
-def _jaccard(a: Set[str], b: Set[str]) -> float:
     if not a and not b:
         return 1.0
     if not a or not b:
         return 0.0
-    inter = len(a & b)
-    union = len(a | b)
-    return inter / union if union else 0.0
+    union = (a | b).bit_count()
+    return (a & b).bit_count() / union if union else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class _EvidenceRow:
+    """Schema-validated evidence item with pre-stripped fields.
+
+    Built once in _load_evidence_map so the per-claim hot path does slot
+    attribute loads instead of dict lookups plus isinstance checks.
+    """
+
+    evidence_id: str
+    excerpt: str
+    context: str
 
 
 class CitationAccuracyVerifier:
@@ -212,8 +230,23 @@ class CitationAccuracyVerifier:
 
     def __init__(self, config: CitationAccuracyGateConfig):
         self._cfg = config
-
-    def verify_claim(self, claim: Mapping[str, Any], evidence_items: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+        # Shared token vocabulary: one bit per distinct token seen by this
+        # verifier. Claims in a project share a bounded vocabulary, so the
+        # bitmasks stay small while set intersections become popcounts.
+        self._vocab: Dict[str, int] = {}
+
+    def _encode_tokens(self, tokens: Iterable[str]) -> int:
+        vocab = self._vocab
+        mask = 0
+        for token in tokens:
+            idx = vocab.get(token)
+            if idx is None:
+                idx = len(vocab)
+                vocab[token] = idx
+            mask |= 1 << idx
+        return mask
+
+    def verify_claim(self, claim: Mapping[str, Any], evidence_items: Sequence[_EvidenceRow]) -> Dict[str, Any]:
         claim_id = str(claim.get("claim_id") or "").strip()
         statement = str(claim.get("statement") or "").strip()
 
@@ -230,34 +263,37 @@ class CitationAccuracyVerifier:
         combined: List[str] = []
         used_ids: List[str] = []
         for item in evidence_items[: self._cfg.max_evidence_items_per_claim]:
-            ev_id = item.get("evidence_id")
-            if isinstance(ev_id, str) and ev_id.strip():
-                used_ids.append(ev_id.strip())
-            excerpt = item.get("excerpt")
-            if isinstance(excerpt, str) and excerpt.strip():
-                combined.append(excerpt)
-            context = item.get("context")
-            if isinstance(context, str) and context.strip():
-                combined.append(context)
-
-        evidence_text = "\n".join(combined)
+            if item.evidence_id:
+                used_ids.append(item.evidence_id)
+            if item.excerpt:
+                combined.append(item.excerpt)
+            if item.context:
+                combined.append(item.context)
 
         reasons: List[str] = []
 
-        claim_tokens = _tokenize(statement)
-        evidence_tokens = _tokenize(evidence_text)
-        keyword_overlap = _jaccard(claim_tokens, evidence_tokens)
+        # Tokenize each fragment individually instead of joining them into one
+        # transient string; repeated evidence items hit the memoized helpers.
+        claim_bits = self._encode_tokens(_tokenize(statement))
+        evidence_bits = 0
+        for fragment in combined:
+            evidence_bits |= self._encode_tokens(_tokenize(fragment))
+        keyword_overlap = _jaccard_bits(claim_bits, evidence_bits)
 
         entity_overlap = 0.0
         if self._cfg.enable_entity_overlap:
-            claim_ents = _extract_named_entities(statement)
-            evidence_ents = _extract_named_entities(evidence_text)
-            entity_overlap = _jaccard(claim_ents, evidence_ents)
+            claim_ent_bits = self._encode_tokens(_extract_named_entities(statement))
+            evidence_ent_bits = 0
+            for fragment in combined:
+                evidence_ent_bits |= self._encode_tokens(_extract_named_entities(fragment))
+            entity_overlap = _jaccard_bits(claim_ent_bits, evidence_ent_bits)
 
         numeric_ok = True
         if self._cfg.enable_numeric_consistency:
-            claim_nums = _filter_year_like_numbers(_extract_numbers(statement))
-            evidence_nums = _filter_year_like_numbers(_extract_numbers(evidence_text))
+            claim_nums = _extract_numbers(statement, exclude_years=True)
+            evidence_nums: set[str] = set()
+            for fragment in combined:
+                evidence_nums |= _extract_numbers(fragment, exclude_years=True)
             if claim_nums and not claim_nums.issubset(evidence_nums):
                 numeric_ok = False
 
@@ -308,10 +344,10 @@ def _iter_evidence_files(project_folder: Path) -> Iterable[Path]:
     return sorted(sources_dir.glob("*/evidence.json"))
 
 
-def _load_evidence_map(project_folder: Path) -> Tuple[Dict[str, Dict[str, Any]], int, int]:
+def _load_evidence_map(project_folder: Path) -> Tuple[Dict[str, _EvidenceRow], int, int]:
     """Return (by_evidence_id, invalid_items, evidence_files_scanned)."""
 
-    by_id: Dict[str, Dict[str, Any]] = {}
+    by_id: Dict[str, _EvidenceRow] = {}
     invalid = 0
     scanned = 0
 
@@ -332,7 +368,13 @@ def _load_evidence_map(project_folder: Path) -> Tuple[Dict[str, Dict[str, Any]],
 
             evidence_id = item.get("evidence_id")
             if isinstance(evidence_id, str) and evidence_id.strip():
-                by_id[evidence_id.strip()] = item
+                excerpt = item.get("excerpt")
+                context = item.get("context")
+                by_id[evidence_id.strip()] = _EvidenceRow(
+                    evidence_id=evidence_id.strip(),
+                    excerpt=excerpt.strip() if isinstance(excerpt, str) else "",
+                    context=context.strip() if isinstance(context, str) else "",
+                )
 
     return by_id, invalid, scanned
 
@@ -448,7 +490,7 @@ def check_citation_accuracy_gate(
             )
             continue
 
-        evidence_items: List[Dict[str, Any]] = []
+        evidence_items: List[_EvidenceRow] = []
         missing_any = False
         for ev_id in evidence_ids_list:
             item = evidence_map.get(ev_id)
@@ -464,7 +506,7 @@ def check_citation_accuracy_gate(
                     "claim_id": str(claim.get("claim_id") or "").strip(),
                     "citation_keys": claim.get("citation_keys") if isinstance(claim.get("citation_keys"), list) else [],
                     "evidence_ids": evidence_ids_list,
-                    "evidence_ids_used": [i.get("evidence_id") for i in evidence_items if isinstance(i.get("evidence_id"), str)],
+                    "evidence_ids_used": [i.evidence_id for i in evidence_items if i.evidence_id],
                     "checked": False,
                     "ok": True,
                     "reasons": ["evidence_ids_unresolved"],
@@ -70,6 +70,7 @@ class TracingConfig:
     SERVICE_NAME: str = "gia-research-agents"
     OTLP_ENDPOINT: str = os.getenv("OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
     ENABLED: bool = os.getenv("ENABLE_TRACING", "false").lower() == "true"
+    INSTRUMENT_HTTPX: bool = os.getenv("TRACING_INSTRUMENT_HTTPX", "true").lower() == "true"
 
 
 @dataclass(frozen=True)
@@ -19,6 +19,7 @@ Author: Gia Tenica*
 for more information see: https://giatenica.com
 """
 
+import functools
 import os
 import re
 from pathlib import Path
@@ -304,17 +305,8 @@ class ClaudeClient:
         
         # Configure timeout: 600s (10 min) total, 30s connect for long-running LLM calls
         # Complex reasoning tasks with large contexts can take several minutes
-        timeout_config = httpx.Timeout(600.0, connect=30.0)
-        
-        self.client = anthropic.Anthropic(
-            api_key=self.api_key,
-            timeout=timeout_config,
-        )
-        self.async_client = anthropic.AsyncAnthropic(
-            api_key=self.api_key,
-            timeout=timeout_config,
-        )
-        
+        self._timeout_config = httpx.Timeout(600.0, connect=30.0)
+
         # Handle both string and ModelTier inputs for backward compatibility
         if isinstance(default_model, str):
             tier_map = {"opus": ModelTier.OPUS, "sonnet": ModelTier.SONNET, "haiku": ModelTier.HAIKU}
@@ -327,7 +319,27 @@ class ClaudeClient:
         
         model_info = MODELS[self.default_model]
         logger.info(f"Claude client initialized with model: {model_info.id}")
-    
+
+    @functools.cached_property
+    def client(self) -> anthropic.Anthropic:
+        """Sync SDK client, constructed on first use.
+
+        Deferring construction keeps ClaudeClient() cheap for callers that
+        only read model metadata and never hit the API.
+        """
+        return anthropic.Anthropic(
+            api_key=self.api_key,
+            timeout=self._timeout_config,
+        )
+
+    @functools.cached_property
+    def async_client(self) -> anthropic.AsyncAnthropic:
+        """Async SDK client, constructed on first use."""
+        return anthropic.AsyncAnthropic(
+            api_key=self.api_key,
+            timeout=self._timeout_config,
+        )
+
     def get_model_for_task(self, task: TaskType) -> ModelTier:
         """
         Get the recommended model tier for a specific task type.
@@ -36,10 +36,11 @@ for more information see: https://giatenica.com
 """
 
 import asyncio
-import hashlib
 import os
 import re
 import threading
+import time
+from collections import deque
 from typing import Optional, List
 from dataclasses import dataclass, field
 from enum import Enum
@@ -48,8 +49,21 @@ from edison_client import JobNames as EdisonJobNames
 from loguru import logger
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
-# Track active/recent Edison requests to prevent duplicates
+# Retry policy for Edison task submission, built once at import instead of
+# re-creating the tenacity config on every search call.
+_EDISON_RETRY = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=2, min=2, max=30),
+    retry=retry_if_exception_type((ConnectionError, TimeoutError, OSError)),
+    reraise=True,
+)
+
+# Track active/recent Edison requests to prevent duplicates.
+# The deque holds (timestamp, hash) pairs oldest-first; expiry pops from the
+# left and only deletes a dict entry when its stored timestamp still matches,
+# which guards against hashes that were refreshed after completion.
 _active_requests: dict[str, float] = {}  # query_hash -> start_time
+_active_requests_order: deque[tuple[float, str]] = deque()
 _request_lock: Optional[asyncio.Lock] = None  # Lazy-init asyncio.Lock
 _lock_init = threading.Lock()  # Thread-safe lock initialization
 
@@ -57,6 +71,101 @@ _lock_init = threading.Lock()  # Thread-safe lock initialization
 _MIN_TITLE_LENGTH_FOR_SPLIT = 20  # Minimum chars to consider text as title vs journal
 _TITLE_DEDUP_KEY_LENGTH = 50  # Chars of lowercased title used for deduplication
 
+# Patterns for _extract_citations_from_text, compiled once at module load so the
+# per-entry loop does not pay a regex-cache lookup per call.
+_REFS_HEADER_RE = re.compile(r'(?:^|\n)(?:#+\s*)?References?\s*\n', re.IGNORECASE)
+_DOI_RE = re.compile(r'doi:\s*(10\.[^\s,]+)', re.IGNORECASE)
+_URL_RE = re.compile(r'URL:\s*(https?://[^\s,]+)')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_PREFIX_RE = re.compile(r'^\d+\.\s*\([^)]+\):\s*')
+_TRAILER_RE = re.compile(r'\s*This article has \d+ citations?\.\s*$', re.IGNORECASE)
+# URL and DOI metadata stripped in one alternation pass instead of two re.sub calls.
+_METADATA_STRIP_RE = re.compile(r'\s*(?:URL:\s*https?://[^\s,]+|doi:\s*10\.[^\s,]+)[,\s]*', re.IGNORECASE)
+_AUTHOR_AND_RE = re.compile(r'\s+and\s+', re.IGNORECASE)
+_INLINE_DOI_RE = re.compile(r'10\.\d{4,}/\S+')
+_SENTENCE_BOUNDARY_RE = re.compile(r'\. ')
+
+
+def _json_default(obj):
+    """Serialize values orjson does not handle natively (JobStatus)."""
+    if isinstance(obj, JobStatus):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(obj, to_dict) -> bytes:
+    """Serialize a dataclass to JSON bytes, preferring orjson when installed.
+
+    orjson walks the dataclass fields directly in native code; without it,
+    fall back to the explicit to_dict plus stdlib json.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        return json.dumps(to_dict()).encode("utf-8")
+    return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_DATACLASS)
+
+
+def _is_entry_start(line: str) -> bool:
+    """True when a line opens a numbered reference entry ("N. ...")."""
+    if not line or not line[0].isdigit():
+        return False
+    k = 1
+    while k < len(line) and line[k].isdigit():
+        k += 1
+    return k + 1 < len(line) and line[k] == "." and line[k + 1].isspace()
+
+
+def _split_reference_entries(refs_section: str) -> List[str]:
+    """Split a References section into numbered entries.
+
+    One splitlines pass with cheap prefix checks replaces the lookahead
+    regex split; continuation lines are folded into the current entry.
+    """
+    entries: List[str] = []
+    current: List[str] = []
+    for line in refs_section.splitlines():
+        stripped = line.strip()
+        if _is_entry_start(stripped):
+            if current:
+                entries.append(" ".join(current))
+            current = [stripped]
+        elif current and stripped:
+            current.append(stripped)
+    if current:
+        entries.append(" ".join(current))
+    return entries
+
+
+def _split_on_sentence_boundaries(cleaned: str) -> List[str]:
+    """Split '. ' separated segments, skipping author-initial periods.
+
+    Candidate boundaries come from one C-level finditer pass; Python only
+    inspects the single word before each period. A boundary is skipped
+    when that word is one uppercase letter (an author initial such as
+    "John P. Smith"). An exact lookbehind cannot express the one-letter-
+    word check, so the guard stays in Python.
+    """
+    parts: List[str] = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY_RE.finditer(cleaned):
+        i = match.start()
+        # Walk back over the word preceding the period.
+        j = i - 1
+        while j >= start and not cleaned[j].isspace():
+            j -= 1
+        if i - j == 2 and cleaned[i - 1].isupper():
+            # Author initial; keep scanning within the current segment.
+            continue
+        parts.append(cleaned[start:i].strip())
+        start = match.end()
+    tail = cleaned[start:].strip()
+    if tail:
+        parts.append(tail)
+    return parts
+
 
 def _get_request_lock() -> asyncio.Lock:
     """Get or create the async request lock in a thread-safe manner."""
@@ -77,11 +186,11 @@ class JobStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+@dataclass(slots=True)
 class Citation:
     """A literature citation from Edison."""
     title: str
-    authors: List[str]
+    authors: tuple[str, ...]
     year: int
     journal: Optional[str] = None
     doi: Optional[str] = None
@@ -97,27 +206,26 @@ class Citation:
             first_author = self.authors[0].split()[-1] if self.authors else "Unknown"
             key = f"{first_author}{self.year}"
         
-        authors_str = " and ".join(self.authors)
-        
-        bibtex = f"@article{{{key},\n"
-        bibtex += f"  title = {{{self.title}}},\n"
-        bibtex += f"  author = {{{authors_str}}},\n"
-        bibtex += f"  year = {{{self.year}}},\n"
-        
+        # Build lines once and join; repeated += reallocates the whole string.
+        parts = [
+            f"@article{{{key},",
+            f"  title = {{{self.title}}},",
+            f"  author = {{{' and '.join(self.authors)}}},",
+            f"  year = {{{self.year}}},",
+        ]
         if self.journal:
-            bibtex += f"  journal = {{{self.journal}}},\n"
+            parts.append(f"  journal = {{{self.journal}}},")
         if self.doi:
-            bibtex += f"  doi = {{{self.doi}}},\n"
+            parts.append(f"  doi = {{{self.doi}}},")
         if self.url:
-            bibtex += f"  url = {{{self.url}}},\n"
-        
-        bibtex += "}\n"
-        return bibtex
+            parts.append(f"  url = {{{self.url}}},")
+        parts.append("}\n")
+        return "\n".join(parts)
     
     def to_dict(self) -> dict:
         return {
             "title": self.title,
-            "authors": self.authors,
+            "authors": list(self.authors),
             "year": self.year,
             "journal": self.journal,
             "doi": self.doi,
@@ -127,24 +235,38 @@ class Citation:
             "paper_id": self.paper_id,
             "citations": self.citations,
         }
-    
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes without an intermediate dict when possible."""
+        return _dump_json(self, self.to_dict)
+
     @classmethod
     def from_dict(cls, data: dict) -> "Citation":
-        return cls(
-            title=data.get("title", ""),
-            authors=data.get("authors", []),
-            year=data.get("year", 0),
-            journal=data.get("journal"),
-            doi=data.get("doi"),
-            url=data.get("url"),
-            abstract=data.get("abstract"),
-            relevance_score=data.get("relevance_score"),
-            paper_id=data.get("paper_id"),
-            citations=data.get("citations"),
-        )
+        return _citation_from_dict(data)
+
 
+def _citation_from_dict(data: dict) -> Citation:
+    """Specialized Citation constructor for dict payloads.
+
+    Rebuilding N citations from citations_data.json is the hot path; binding
+    data.get once avoids a method lookup per field.
+    """
+    get = data.get
+    return Citation(
+        title=get("title", ""),
+        authors=tuple(get("authors", ())),
+        year=get("year", 0),
+        journal=get("journal"),
+        doi=get("doi"),
+        url=get("url"),
+        abstract=get("abstract"),
+        relevance_score=get("relevance_score"),
+        paper_id=get("paper_id"),
+        citations=get("citations"),
+    )
 
-@dataclass
+
+@dataclass(slots=True)
 class LiteratureResult:
     """Result from a literature search."""
     query: str = ""
@@ -167,38 +289,40 @@ class LiteratureResult:
             "status": self.status.value,
             "error": self.error,
         }
-    
+
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes without an intermediate dict when possible."""
+        return _dump_json(self, self.to_dict)
+
     @classmethod
     def from_dict(cls, data: dict) -> "LiteratureResult":
+        get = data.get
         return cls(
-            query=data.get("query", ""),
-            response=data.get("response", ""),
-            citations=[Citation.from_dict(c) for c in data.get("citations", [])],
-            total_papers_searched=data.get("total_papers_searched", 0),
-            processing_time=data.get("processing_time", 0.0),
-            job_id=data.get("job_id"),
-            status=JobStatus(data.get("status", "completed")),
-            error=data.get("error"),
+            query=get("query", ""),
+            response=get("response", ""),
+            citations=[_citation_from_dict(c) for c in get("citations", [])],
+            total_papers_searched=get("total_papers_searched", 0),
+            processing_time=get("processing_time", 0.0),
+            job_id=get("job_id"),
+            status=JobStatus(get("status", "completed")),
+            error=get("error"),
         )
     
     def to_bibtex(self) -> str:
         """Generate BibTeX file content from all citations."""
         bibtex_entries = []
-        used_keys = set()
-        
+        # Counter per base key produces the a, b, c... suffixes directly
+        # instead of probing a set for each collision.
+        key_counts: dict[str, int] = {}
+
         for citation in self.citations:
-            first_author = citation.authors[0].split()[-1] if citation.authors else "Unknown"
+            first_author = citation.authors[0].rsplit(" ", 1)[-1] if citation.authors else "Unknown"
             base_key = f"{first_author}{citation.year}"
-            key = base_key
-            suffix = ord('a')
-            
-            while key in used_keys:
-                key = f"{base_key}{chr(suffix)}"
-                suffix += 1
-            
-            used_keys.add(key)
+            n = key_counts.get(base_key, 0)
+            key_counts[base_key] = n + 1
+            key = base_key if n == 0 else f"{base_key}{chr(ord('a') + n - 1)}"
             bibtex_entries.append(citation.to_bibtex(key))
-        
+
         return "\n".join(bibtex_entries)
 
 
@@ -246,6 +370,9 @@ class EdisonClient:
         self.api_key = resolved_key
         self._client = None
         self._init_error: Optional[str] = None
+        # Cached so the per-call task_data build skips the global + enum
+        # attribute lookup.
+        self._literature_job_name = EdisonJobNames.LITERATURE
 
         if not self.api_key:
             logger.warning("EDISON_API_KEY not set; Edison API calls will fail")
@@ -271,6 +398,15 @@ class EdisonClient:
         """Initialization error captured during construction, if any."""
         return self._init_error
     
+    @_EDISON_RETRY
+    async def _arun_with_retry(self, task_data: dict):
+        """Submit a task to Edison with the shared retry policy.
+
+        Defined at class scope so the retry decorator is applied once at
+        class creation instead of building a closure per search call.
+        """
+        return await self._client.arun_tasks_until_done(task_data)
+
     async def search_literature(
         self,
         query: str,
@@ -300,9 +436,6 @@ class EdisonClient:
         Returns:
             LiteratureResult with answer and citations
         """
-        global _active_requests
-        import time
-        
         if not self._client:
             return LiteratureResult(
                 query=query,
@@ -310,13 +443,22 @@ class EdisonClient:
                 error=self._init_error or "Edison API client not configured",
             )
         
-        # Build the full query with context if provided
+        # Build the full query with context if provided; join avoids the
+        # intermediate format-string copy for multi-KB contexts.
         full_query = query
         if context:
-            full_query = f"{query}\n\nContext:\n{context}"
-        
-        # Generate hash for deduplication (based on query content)
-        query_hash = hashlib.sha256(full_query.encode()).hexdigest()[:16]
+            full_query = "".join((query, "\n\nContext:\n", context))
+
+        # Generate hash for deduplication (based on query content).
+        # BLAKE2b with an 8-byte digest gives the same 16-hex-char key as the
+        # previous truncated SHA-256 with less CPU on multi-KB query payloads.
+        # hashlib loads OpenSSL; importing it here keeps module import cheap
+        # for workflows that never reach Edison. The query is encoded once
+        # and the bytes buffer handed straight to the hash.
+        import hashlib
+
+        query_bytes = full_query.encode("utf-8")
+        query_hash = hashlib.blake2b(query_bytes, digest_size=8).hexdigest()
         
         # Use thread-safe lock getter
         request_lock = _get_request_lock()
@@ -324,12 +466,14 @@ class EdisonClient:
         # Check for duplicate/concurrent requests
         async with request_lock:
             current_time = time.time()
-            
-            # Clean up old entries (older than 30 minutes)
-            expired = [h for h, t in _active_requests.items() if current_time - t > 1800]
-            for h in expired:
-                del _active_requests[h]
-            
+
+            # Clean up old entries (older than 30 minutes). The deque is
+            # oldest-first, so pop from the left until we hit a fresh one.
+            while _active_requests_order and current_time - _active_requests_order[0][0] > 1800:
+                ts, h = _active_requests_order.popleft()
+                if _active_requests.get(h) == ts:
+                    del _active_requests[h]
+
             # Check if this query is already in progress or was recently made
             if query_hash in _active_requests:
                 elapsed = current_time - _active_requests[query_hash]
@@ -342,9 +486,10 @@ class EdisonClient:
                     status=JobStatus.FAILED,
                     error=f"Duplicate request blocked. A similar query was submitted {elapsed:.1f}s ago.",
                 )
-            
+
             # Mark this request as active
             _active_requests[query_hash] = current_time
+            _active_requests_order.append((current_time, query_hash))
             logger.info(f"Edison request registered (hash={query_hash[:8]})")
         
         start_time = time.time()
@@ -354,49 +499,14 @@ class EdisonClient:
             
             # Use async method from edison-client with retry logic
             task_data = {
-                "name": EdisonJobNames.LITERATURE,
+                "name": self._literature_job_name,
                 "query": full_query,
             }
-            
-            @retry(
-                stop=stop_after_attempt(3),
-                wait=wait_exponential(multiplier=2, min=2, max=30),
-                retry=retry_if_exception_type((ConnectionError, TimeoutError, OSError)),
-                reraise=True,
-            )
-            async def _make_edison_request():
-                return await self._client.arun_tasks_until_done(task_data)
-            
+
             # arun_tasks_until_done waits for completion
-            task_response = await _make_edison_request()
-            
-            processing_time = time.time() - start_time
-            logger.info(f"Edison search completed in {processing_time:.1f}s (hash={query_hash[:8]})")
-            
-            # Edison returns a LIST of PQATaskResponse objects; extract the first one
-            actual_response = task_response
-            if isinstance(task_response, list) and len(task_response) > 0:
-                actual_response = task_response[0]
-                logger.debug(f"Extracted first response from list of {len(task_response)}")
-            
-            # Parse response - prefer formatted_answer (includes References), fall back to answer
-            answer = getattr(actual_response, 'formatted_answer', None)
-            if not answer:
-                answer = getattr(actual_response, 'answer', str(actual_response))
-            
-            # Extract citations if available
-            citations = self._parse_citations(actual_response)
-            
-            return LiteratureResult(
-                query=query,
-                response=answer,
-                citations=citations,
-                total_papers_searched=len(citations),
-                processing_time=processing_time,
-                job_id=getattr(task_response, 'id', None),
-                status=JobStatus.COMPLETED,
-            )
-            
+            task_response = await self._arun_with_retry(task_data)
+
+            return self._finalize_response(task_response, query, start_time)
         except Exception as e:
             logger.error(f"Edison search error: {e}")
             return LiteratureResult(
@@ -406,12 +516,14 @@ class EdisonClient:
                 processing_time=time.time() - start_time,
             )
         finally:
-            # Remove from active requests after completion (success or failure)
-            # Keep in tracking for 5 minutes to prevent rapid re-submission
-            async with request_lock:
-                if query_hash in _active_requests:
-                    # Update timestamp to mark completion time for dedup window
-                    _active_requests[query_hash] = time.time()
+            # Keep the entry in tracking to prevent rapid re-submission, with
+            # the timestamp refreshed to the completion time. Single dict
+            # stores and deque appends are atomic under the GIL, so no lock is
+            # needed here; the new deque entry keeps expiry ordering intact.
+            if query_hash in _active_requests:
+                completed_at = time.time()
+                _active_requests[query_hash] = completed_at
+                _active_requests_order.append((completed_at, query_hash))
     
     def search_literature_sync(
         self,
@@ -435,49 +547,24 @@ class EdisonClient:
                 error=self._init_error or "Edison API client not configured",
             )
         
-        import time
         start_time = time.time()
-        
+
         try:
             full_query = query
             if context:
-                full_query = f"{query}\n\nContext:\n{context}"
-            
+                full_query = "".join((query, "\n\nContext:\n", context))
+
             logger.info(f"Submitting literature search to Edison: {query[:100]}...")
-            
+
             task_data = {
-                "name": EdisonJobNames.LITERATURE,
+                "name": self._literature_job_name,
                 "query": full_query,
             }
             
             # Synchronous method - blocks until done
             task_response = self._client.run_tasks_until_done(task_data)
-            
-            processing_time = time.time() - start_time
-            logger.info(f"Edison search completed in {processing_time:.1f}s")
-            
-            # Edison returns a LIST of PQATaskResponse objects; extract the first one
-            actual_response = task_response
-            if isinstance(task_response, list) and len(task_response) > 0:
-                actual_response = task_response[0]
-                logger.debug(f"Extracted first response from list of {len(task_response)}")
-            
-            # Parse response - prefer formatted_answer (includes References), fall back to answer
-            answer = getattr(actual_response, 'formatted_answer', None)
-            if not answer:
-                answer = getattr(actual_response, 'answer', str(actual_response))
-            citations = self._parse_citations(actual_response)
-            
-            return LiteratureResult(
-                query=query,
-                response=answer,
-                citations=citations,
-                total_papers_searched=len(citations),
-                processing_time=processing_time,
-                job_id=getattr(task_response, 'id', None),
-                status=JobStatus.COMPLETED,
-            )
-            
+
+            return self._finalize_response(task_response, query, start_time)
         except Exception as e:
             logger.error(f"Edison search error: {e}")
             return LiteratureResult(
@@ -487,6 +574,38 @@ class EdisonClient:
                 processing_time=time.time() - start_time,
             )
     
+    def _finalize_response(self, task_response, query: str, start_time: float) -> LiteratureResult:
+        """Normalize an Edison task response into a LiteratureResult.
+
+        Shared by the sync and async search paths so the result-shape
+        handling lives in one place.
+        """
+        processing_time = time.time() - start_time
+        logger.info(f"Edison search completed in {processing_time:.1f}s")
+
+        # Edison returns a LIST of PQATaskResponse objects; extract the first one
+        actual_response = task_response
+        if isinstance(task_response, list) and len(task_response) > 0:
+            actual_response = task_response[0]
+            logger.opt(lazy=True).debug("Extracted first response from list of {}", lambda: len(task_response))
+
+        # Parse response - prefer formatted_answer (includes References), fall back to answer
+        answer = getattr(actual_response, 'formatted_answer', None)
+        if not answer:
+            answer = getattr(actual_response, 'answer', str(actual_response))
+
+        citations = self._parse_citations(actual_response)
+
+        return LiteratureResult(
+            query=query,
+            response=answer,
+            citations=citations,
+            total_papers_searched=len(citations),
+            processing_time=processing_time,
+            job_id=getattr(task_response, 'id', None),
+            status=JobStatus.COMPLETED,
+        )
+
     def _parse_citations(self, task_response) -> List[Citation]:
         """Parse citations from Edison task response.
         
@@ -498,20 +617,16 @@ class EdisonClient:
         parsing embedded references from the formatted answer.
         """
         citations: List[Citation] = []
-        
-        # Try different possible attributes where citations might be stored
+
+        # Try different possible attributes where citations might be stored.
+        # A single getattr with default avoids the paired hasattr+access
+        # lookups; PQATaskResponse normally exposes .citations.
         raw_citations = None
-        
-        # PQATaskResponse has citations attribute
-        if hasattr(task_response, 'citations'):
-            raw_citations = task_response.citations
-            logger.debug(f"Found .citations attribute with {len(raw_citations) if raw_citations else 0} items")
-        elif hasattr(task_response, 'references'):
-            raw_citations = task_response.references
-            logger.debug(f"Found .references attribute with {len(raw_citations) if raw_citations else 0} items")
-        elif hasattr(task_response, 'papers'):
-            raw_citations = task_response.papers
-            logger.debug(f"Found .papers attribute with {len(raw_citations) if raw_citations else 0} items")
+        for attr in ('citations', 'references', 'papers'):
+            raw_citations = getattr(task_response, attr, None)
+            if raw_citations:
+                logger.opt(lazy=True).debug("Found .{}", lambda a=attr, n=raw_citations: f"{a} attribute with {len(n)} items")
+                break
         else:
             logger.debug("No structured citation attributes found on task_response")
         
@@ -522,7 +637,7 @@ class EdisonClient:
                     if isinstance(ref, dict):
                         citation = Citation(
                             title=ref.get('title', ''),
-                            authors=ref.get('authors', []),
+                            authors=tuple(ref.get('authors', ())),
                             year=ref.get('year', 0),
                             journal=ref.get('journal'),
                             doi=ref.get('doi'),
@@ -533,7 +648,7 @@ class EdisonClient:
                         # Object with attributes
                         citation = Citation(
                             title=getattr(ref, 'title', ''),
-                            authors=getattr(ref, 'authors', []),
+                            authors=tuple(getattr(ref, 'authors', ()) or ()),
                             year=getattr(ref, 'year', 0),
                             journal=getattr(ref, 'journal', None),
                             doi=getattr(ref, 'doi', None),
@@ -541,13 +656,25 @@ class EdisonClient:
                             abstract=getattr(ref, 'abstract', None),
                         )
                     else:
-                        # String citation - parse as best as possible
+                        # String citation - recover a DOI when present; entries
+                        # with no recoverable metadata are skipped so downstream
+                        # BibTeX output is not polluted with "Unknown0" stubs.
+                        text_ref = str(ref).strip()
+                        if not text_ref:
+                            logger.debug("Skipping citation entry with no recoverable metadata")
+                            continue
+                        doi_match = _INLINE_DOI_RE.search(text_ref)
                         citation = Citation(
-                            title=str(ref),
-                            authors=[],
+                            title=text_ref,
+                            authors=(),
                             year=0,
+                            doi=doi_match.group(0).rstrip('.,;') if doi_match else None,
                         )
-                    
+
+                    if not citation.title and not citation.doi:
+                        logger.debug("Skipping citation entry with no title or DOI")
+                        continue
+
                     citations.append(citation)
                     
                 except Exception as e:
@@ -558,7 +685,7 @@ class EdisonClient:
         if not citations:
             formatted_answer = getattr(task_response, 'formatted_answer', None)
             if formatted_answer and isinstance(formatted_answer, str):
-                logger.debug(f"Falling back to formatted_answer text extraction ({len(formatted_answer)} chars)")
+                logger.opt(lazy=True).debug("Falling back to formatted_answer text extraction ({} chars)", lambda: len(formatted_answer))
                 citations = self._extract_citations_from_text(formatted_answer)
             else:
                 logger.debug("No formatted_answer available for text extraction fallback")
@@ -590,17 +717,17 @@ class EdisonClient:
         seen_titles: set[str] = set()
         
         # Find References section (case-insensitive, may have markdown headers)
-        refs_match = re.search(r'(?:^|\n)(?:#+\s*)?References?\s*\n', text, re.IGNORECASE)
+        refs_match = _REFS_HEADER_RE.search(text)
         if not refs_match:
             logger.debug("No References section found in Edison formatted_answer")
             return citations
         
         refs_section = text[refs_match.end():]
-        logger.debug(f"Found References section with {len(refs_section)} chars")
+        logger.opt(lazy=True).debug("Found References section with {} chars", lambda: len(refs_section))
         
         # Split into individual reference entries (numbered lines)
-        entries = re.split(r'\n(?=\d+\.\s)', refs_section)
-        logger.debug(f"Split into {len(entries)} potential reference entries")
+        entries = _split_reference_entries(refs_section)
+        logger.opt(lazy=True).debug("Split into {} potential reference entries", lambda: len(entries))
         
         for entry in entries:
             entry = entry.strip()
@@ -610,35 +737,34 @@ class EdisonClient:
             # Extract DOI first (most reliable identifier for deduplication)
             # DOI format: 10.XXXXX/XXXXX - can contain letters, numbers, dots, slashes, dashes
             # Stop at whitespace, comma, or end of sentence that isn't part of DOI
-            doi_match = re.search(r'doi:\s*(10\.[^\s,]+)', entry, re.IGNORECASE)
+            doi_match = _DOI_RE.search(entry)
             doi = doi_match.group(1).rstrip('.,;') if doi_match else None
             
             # Skip if we've already processed this DOI (Edison returns same paper
             # multiple times with different page ranges)
             if doi and doi.lower() in seen_dois:
-                logger.debug(f"Skipping duplicate DOI: {doi}")
+                logger.opt(lazy=True).debug("Skipping duplicate DOI: {}", lambda d=doi: d)
                 continue
             if doi:
                 seen_dois.add(doi.lower())
             
             # Extract URL (Edison format: "URL: https://...")
-            url_match = re.search(r'URL:\s*(https?://[^\s,]+)', entry)
+            url_match = _URL_RE.search(entry)
             url = url_match.group(1).rstrip('.,') if url_match else None
             
             # Extract year (look for 4-digit year in reasonable range)
-            year_match = re.search(r'\b(19|20)\d{2}\b', entry)
+            year_match = _YEAR_RE.search(entry)
             year = int(year_match.group(0)) if year_match else 0
             
             # Edison format: "N. (citation_key pages X-Y): Authors. Title. Journal, Date. URL: ..., doi:... This article has N citations."
             # Step 1: Remove entry number and citation key prefix
-            cleaned = re.sub(r'^\d+\.\s*\([^)]+\):\s*', '', entry)
-            
+            cleaned = _PREFIX_RE.sub('', entry)
+
             # Step 2: Remove trailing metadata "This article has N citations."
-            cleaned = re.sub(r'\s*This article has \d+ citations?\.\s*$', '', cleaned, flags=re.IGNORECASE)
-            
-            # Step 3: Remove URL and DOI metadata from end
-            cleaned = re.sub(r'\s*URL:\s*https?://[^\s,]+[,\s]*', ' ', cleaned)
-            cleaned = re.sub(r'\s*doi:\s*10\.[^\s,]+[,\s]*', ' ', cleaned, flags=re.IGNORECASE)
+            cleaned = _TRAILER_RE.sub('', cleaned)
+
+            # Step 3: Remove URL and DOI metadata in a single alternation pass
+            cleaned = _METADATA_STRIP_RE.sub(' ', cleaned)
             cleaned = cleaned.strip().rstrip('.,')
             
             if not cleaned:
@@ -649,27 +775,8 @@ class EdisonClient:
             # Authors typically contain "and" for multiple authors
             # Title is the longest segment after authors
             
-            # Find the first ". " that's not an initial (initial = single uppercase letter before period)
-            parts = []
-            current = ""
-            i = 0
-            while i < len(cleaned):
-                if cleaned[i:i+2] == ". ":
-                    before_period = current.split()[-1] if current.split() else ""
-                    # Check if this is an author initial (single capital letter)
-                    is_initial = (len(before_period) == 1 and before_period.isupper())
-                    if is_initial:
-                        current += ". "
-                        i += 2
-                    else:
-                        parts.append(current.strip())
-                        current = ""
-                        i += 2
-                else:
-                    current += cleaned[i]
-                    i += 1
-            if current.strip():
-                parts.append(current.strip())
+            # Find each ". " that's not an initial (initial = single uppercase letter before period)
+            parts = _split_on_sentence_boundaries(cleaned)
             
             # Fallback if splitting didn't work well
             if len(parts) < 2:
@@ -691,14 +798,14 @@ class EdisonClient:
                 # Deduplicate by title if no DOI
                 title_key = title.lower()[:_TITLE_DEDUP_KEY_LENGTH]
                 if not doi and title_key in seen_titles:
-                    logger.debug(f"Skipping duplicate title: {title[:50]}...")
+                    logger.opt(lazy=True).debug("Skipping duplicate title: {}...", lambda t=title: t[:50])
                     continue
                 seen_titles.add(title_key)
                 
                 # Parse authors (handle "and" separator)
                 authors = []
                 if authors_str:
-                    and_parts = re.split(r'\s+and\s+', authors_str, flags=re.IGNORECASE)
+                    and_parts = _AUTHOR_AND_RE.split(authors_str)
                     for and_part in and_parts:
                         and_part = and_part.strip()
                         if and_part and len(and_part) > 1:
@@ -706,14 +813,14 @@ class EdisonClient:
                 
                 citation = Citation(
                     title=title,
-                    authors=authors if authors else ["Unknown"],
+                    authors=tuple(authors) if authors else ("Unknown",),
                     year=year,
                     journal=journal,
                     doi=doi,
                     url=url,
                 )
                 citations.append(citation)
-                logger.debug(f"Extracted citation: {title[:50]}... (DOI: {doi})")
+                logger.opt(lazy=True).debug("Extracted citation: {}...", lambda t=title, d=doi: f"{t[:50]}... (DOI: {d})")
         
         logger.info(f"Extracted {len(citations)} unique citations from Edison formatted_answer")
         return citations
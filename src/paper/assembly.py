@@ -10,6 +10,9 @@ for more information see: https://giatenica.com
 from __future__ import annotations
 
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -26,6 +29,25 @@ _AUTOGEN_DISABLE_END = "% === AUTOGEN: disable template sections end ==="
 _AUTOGEN_ARTIFACTS_BEGIN = "% === AUTOGEN: generated artifacts begin ==="
 _AUTOGEN_ARTIFACTS_END = "% === AUTOGEN: generated artifacts end ==="
 
+# All three begin markers in one pattern so the idempotency check scans
+# main.tex once instead of once per marker.
+_AUTOGEN_MARKERS_RE = re.compile(
+    "|".join(re.escape(m) for m in (_AUTOGEN_INPUT_BEGIN, _AUTOGEN_DISABLE_BEGIN, _AUTOGEN_ARTIFACTS_BEGIN))
+)
+
+_PREFERRED_SECTION_ORDER = (
+    "introduction.tex",
+    "related_work.tex",
+    "methods.tex",
+    "results.tex",
+    "discussion.tex",
+)
+_PREFERRED_SECTION_RANK = {name: idx for idx, name in enumerate(_PREFERRED_SECTION_ORDER)}
+
+
+def _section_sort_key(name: str) -> Tuple[int, str]:
+    return (_PREFERRED_SECTION_RANK.get(name, 999), name)
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -38,30 +60,40 @@ def _issue(kind: str, message: str, *, details: Optional[Dict[str, Any]] = None)
     return out
 
 
+def _write_if_changed(path: Path, text: str) -> bool:
+    """Write text to path unless the file already holds that exact content.
+
+    Skipping the no-op write preserves the mtime, which latexmk uses to
+    decide whether a recompile is needed. Returns True when written.
+    """
+    data = text.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
 def discover_section_relpaths(project_folder: Path) -> List[str]:
     """Discover section .tex files in outputs/sections."""
     sections_dir = project_folder / "outputs" / "sections"
-    if not sections_dir.exists() or not sections_dir.is_dir():
+    try:
+        with os.scandir(sections_dir) as it:
+            names = [
+                entry.name
+                for entry in it
+                if entry.name.endswith(".tex")
+                and not entry.name.startswith(".")
+                and entry.is_file(follow_symlinks=False)
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
 
-    paths: List[Path] = [p for p in sections_dir.glob("*.tex") if p.is_file() and not p.name.startswith(".")]
-
-    preferred_order = [
-        "introduction.tex",
-        "related_work.tex",
-        "methods.tex",
-        "results.tex",
-        "discussion.tex",
-    ]
-    preferred_rank = {name: idx for idx, name in enumerate(preferred_order)}
-
-    def _sort_key(p: Path) -> tuple:
-        return (preferred_rank.get(p.name, 999), p.name)
-
-    rels: List[str] = []
-    for p in sorted(paths, key=_sort_key):
-        rels.append(str(p.relative_to(project_folder)))
-    return rels
+    names.sort(key=_section_sort_key)
+    prefix = "outputs/sections/"
+    return [prefix + name for name in names]
 
 
 def write_generated_sections_tex(project_folder: Path, section_relpaths: List[str]) -> Tuple[Path, List[Dict[str, Any]]]:
@@ -82,19 +114,14 @@ def write_generated_sections_tex(project_folder: Path, section_relpaths: List[st
             )
         )
 
-    lines: List[str] = []
-    lines.append("% Generated section includes")
-    lines.append("% This file is written by paper assembly")
-    lines.append("")
-
-    for rel in section_relpaths:
-        rel_norm = rel.replace("\\", "/")
-        input_path = "../" + rel_norm
-        lines.append(f"% --- {rel_norm} ---")
-        lines.append(f"\\input{{{input_path}}}")
-        lines.append("")
+    header = "% Generated section includes\n% This file is written by paper assembly\n"
+    body = "\n\n".join(
+        f"% --- {rel_norm} ---\n\\input{{../{rel_norm}}}"
+        for rel_norm in (rel.replace("\\", "/") for rel in section_relpaths)
+    )
+    content = header + "\n" + body + "\n" if body else header
 
-    out_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+    _write_if_changed(out_path, content)
     return out_path, issues
 
 
@@ -108,18 +135,24 @@ def write_generated_tables_figures_tex(project_folder: Path) -> Tuple[Tuple[Path
     tables_path = paper_dir / "generated_tables.tex"
     figures_path = paper_dir / "generated_figures.tex"
 
-    tables_tex, _table_labels = generate_tables_include_tex(project_folder)
-    figures_tex, _figure_labels = generate_figures_include_tex(project_folder)
+    # The two include generators scan the filesystem independently; run
+    # them concurrently so neither blocks on the other's I/O.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        tables_future = pool.submit(generate_tables_include_tex, project_folder)
+        figures_future = pool.submit(generate_figures_include_tex, project_folder)
+        tables_tex, _table_labels = tables_future.result()
+        figures_tex, _figure_labels = figures_future.result()
 
-    tables_path.write_text(tables_tex, encoding="utf-8")
-    figures_path.write_text(figures_tex, encoding="utf-8")
+    _write_if_changed(tables_path, tables_tex)
+    _write_if_changed(figures_path, figures_tex)
 
     return (tables_path, figures_path), issues
 
 
 def inject_generated_sections_into_main(main_tex: str) -> Tuple[str, bool, Optional[str]]:
     """Inject autogen markers and includes into main.tex."""
-    if _AUTOGEN_INPUT_BEGIN in main_tex and _AUTOGEN_DISABLE_BEGIN in main_tex and _AUTOGEN_ARTIFACTS_BEGIN in main_tex:
+    hits = {m.group(0) for m in _AUTOGEN_MARKERS_RE.finditer(main_tex)}
+    if len(hits) == 3:
         return main_tex, False, None
 
     intro_marker = "%=============================================================================\n% 1. INTRODUCTION"
@@ -137,16 +170,18 @@ def inject_generated_sections_into_main(main_tex: str) -> Tuple[str, bool, Optio
     template_sections = main_tex[intro_idx:refs_idx]
     after = main_tex[refs_idx:]
 
-    new_tex = (
-        before
-        + f"\n{_AUTOGEN_INPUT_BEGIN}\n\\input{{generated_sections.tex}}\n{_AUTOGEN_INPUT_END}\n\n"
-        + f"\n{_AUTOGEN_ARTIFACTS_BEGIN}\n\\input{{generated_tables.tex}}\n\\input{{generated_figures.tex}}\n{_AUTOGEN_ARTIFACTS_END}\n\n"
-        + f"{_AUTOGEN_DISABLE_BEGIN}\n% Original template sections below (disabled):\n"
-        + "% " + template_sections.replace("\n", "\n% ")
-        + f"\n{_AUTOGEN_DISABLE_END}\n\n"
-        + after
-    )
-    return new_tex, True, None
+    # Build via a single join to avoid the repeated full-copy allocations
+    # of a chained + concatenation on large main.tex files.
+    parts = [
+        before,
+        "\n", _AUTOGEN_INPUT_BEGIN, "\n\\input{generated_sections.tex}\n", _AUTOGEN_INPUT_END, "\n\n",
+        "\n", _AUTOGEN_ARTIFACTS_BEGIN, "\n\\input{generated_tables.tex}\n\\input{generated_figures.tex}\n", _AUTOGEN_ARTIFACTS_END, "\n\n",
+        _AUTOGEN_DISABLE_BEGIN, "\n% Original template sections below (disabled):\n",
+        "% ", "\n% ".join(template_sections.split("\n")),
+        "\n", _AUTOGEN_DISABLE_END, "\n\n",
+        after,
+    ]
+    return "".join(parts), True, None
 
 
 def assemble_paper(project_folder: Path) -> Dict[str, Any]:
@@ -179,14 +214,13 @@ def assemble_paper(project_folder: Path) -> Dict[str, Any]:
     
     if paper_main_path.exists():
         try:
-            main_tex = paper_main_path.read_text(encoding="utf-8")
+            main_tex = paper_main_path.read_bytes().decode("utf-8")
             new_tex, changed, error_code = inject_generated_sections_into_main(main_tex)
             
             if error_code:
                 issues.append(_issue("main_tex_patch_failed", "Could not locate expected markers in paper/main.tex", details={"error": error_code}))
             
-            if changed:
-                paper_main_path.write_text(new_tex, encoding="utf-8")
+            if changed and _write_if_changed(paper_main_path, new_tex):
                 main_tex_updated = True
                 logger.info("Updated paper/main.tex with generated sections")
         except Exception as e:
@@ -206,3 +240,16 @@ def assemble_paper(project_folder: Path) -> Dict[str, Any]:
         "section_relpaths": section_relpaths,
         "issues": issues,
     }
+
+
+def assemble_papers(project_folders: List[Path]) -> List[Dict[str, Any]]:
+    """Assemble several papers concurrently.
+
+    Each folder is processed by assemble_paper on a worker thread; results
+    are returned in input order.
+    """
+    if not project_folders:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(8, len(project_folders))) as pool:
+        return list(pool.map(assemble_paper, project_folders))
@@ -9,8 +9,12 @@ for more information see: https://giatenica.com
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import shutil
 import subprocess
+import threading
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -29,6 +33,15 @@ def _issue(kind: str, message: str, *, details: Optional[Dict[str, Any]] = None)
     return out
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """shutil.which with memoization; toolchains do not move mid-run.
+
+    Tests can reset via _which.cache_clear().
+    """
+    return shutil.which(name)
+
+
 def _tail_text(text: str, max_chars: int = 8000) -> str:
     if not text:
         return ""
@@ -37,38 +50,80 @@ def _tail_text(text: str, max_chars: int = 8000) -> str:
     return text[-max_chars:]
 
 
+# Number of trailing output lines kept per stream (roughly the 8000-char
+# tails previously extracted from fully buffered output).
+_TAIL_MAX_LINES = 200
+
+
+def _drain_stream(stream, tail: "deque[str]") -> None:
+    with stream:
+        for line in stream:
+            tail.append(line.rstrip("\n"))
+
+
 def _run_cmd(cmd: List[str], *, cwd: Path, timeout_s: int = 900) -> Dict[str, Any]:
-    """Run a shell command and capture output."""
+    """Run a shell command, keeping only a bounded tail of its output.
+
+    stdout/stderr are drained line-by-line into fixed-size deques so memory
+    stays O(tail size) even for multi-MB LaTeX logs.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+    stdout_tail: deque[str] = deque(maxlen=_TAIL_MAX_LINES)
+    stderr_tail: deque[str] = deque(maxlen=_TAIL_MAX_LINES)
+    drains = [
+        threading.Thread(target=_drain_stream, args=(proc.stdout, stdout_tail), daemon=True),
+        threading.Thread(target=_drain_stream, args=(proc.stderr, stderr_tail), daemon=True),
+    ]
+    for t in drains:
+        t.start()
+
+    timed_out = False
     try:
-        proc = subprocess.run(
-            cmd,
-            cwd=str(cwd),
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            capture_output=True,
-            timeout=timeout_s,
-        )
-        return {
-            "ok": proc.returncode == 0,
-            "returncode": proc.returncode,
-            "cmd": cmd,
-            "cwd": str(cwd),
-            "stdout_tail": _tail_text(proc.stdout or ""),
-            "stderr_tail": _tail_text(proc.stderr or ""),
-        }
-    except subprocess.TimeoutExpired as e:
-        stdout = e.stdout.decode("utf-8", "replace") if isinstance(e.stdout, (bytes, bytearray)) else (e.stdout or "")
-        stderr = e.stderr.decode("utf-8", "replace") if isinstance(e.stderr, (bytes, bytearray)) else (e.stderr or "")
-        return {
-            "ok": False,
-            "returncode": None,
-            "cmd": cmd,
-            "cwd": str(cwd),
-            "timeout": True,
-            "stdout_tail": _tail_text(stdout),
-            "stderr_tail": _tail_text(stderr),
-        }
+        proc.wait(timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        proc.kill()
+        proc.wait()
+    for t in drains:
+        t.join()
+
+    result: Dict[str, Any] = {
+        "ok": proc.returncode == 0 and not timed_out,
+        "returncode": None if timed_out else proc.returncode,
+        "cmd": cmd,
+        "cwd": str(cwd),
+        "stdout_tail": _tail_text("\n".join(stdout_tail)),
+        "stderr_tail": _tail_text("\n".join(stderr_tail)),
+    }
+    if timed_out:
+        result["timeout"] = True
+    return result
+
+
+def _aux_digest(build_dir: Path) -> Optional[str]:
+    """Digest of the aux/bbl files a pdflatex rerun depends on.
+
+    Used to detect convergence between passes, the same trick latexmk
+    relies on to stop rerunning. Returns None when no file exists yet.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    found = False
+    for name in ("main.aux", "main.bbl"):
+        try:
+            h.update((build_dir / name).read_bytes())
+            found = True
+        except OSError:
+            continue
+    return h.hexdigest() if found else None
 
 
 def compile_paper(project_folder: Path, timeout_s: int = 900) -> Dict[str, Any]:
@@ -102,10 +157,10 @@ def compile_paper(project_folder: Path, timeout_s: int = 900) -> Dict[str, Any]:
     
     logger.info(f"Compiling paper for: {project_folder}")
     
-    # Find available tools
-    latexmk = shutil.which("latexmk")
-    pdflatex = shutil.which("pdflatex")
-    bibtex = shutil.which("bibtex")
+    # Find available tools (cached after the first compile)
+    latexmk = _which("latexmk")
+    pdflatex = _which("pdflatex")
+    bibtex = _which("bibtex")
     
     build_dir = paper_dir / "build"
     build_dir.mkdir(parents=True, exist_ok=True)
@@ -135,20 +190,37 @@ def compile_paper(project_folder: Path, timeout_s: int = 900) -> Dict[str, Any]:
                 "issues": issues,
             }
         
+        pdflatex_args = [
+            pdflatex,
+            "-interaction=nonstopmode",
+            "-halt-on-error",
+            "-file-line-error",
+            "-recorder",
+            "-output-directory=build",
+            "main.tex",
+        ]
+
         logger.info("Running pdflatex (pass 1)")
-        steps.append(_run_cmd([pdflatex, "-interaction=nonstopmode", "-halt-on-error", "-output-directory=build", "main.tex"], cwd=paper_dir, timeout_s=timeout_s))
-        
+        steps.append(_run_cmd(pdflatex_args, cwd=paper_dir, timeout_s=timeout_s))
+
         if bibtex:
             logger.info("Running bibtex")
             steps.append(_run_cmd([bibtex, "main"], cwd=build_dir, timeout_s=timeout_s))
         else:
             issues.append(_issue("bibtex_missing", "bibtex not found; bibliography may fail"))
-        
-        logger.info("Running pdflatex (pass 2)")
-        steps.append(_run_cmd([pdflatex, "-interaction=nonstopmode", "-halt-on-error", "-output-directory=build", "main.tex"], cwd=paper_dir, timeout_s=timeout_s))
-        
-        logger.info("Running pdflatex (pass 3)")
-        steps.append(_run_cmd([pdflatex, "-interaction=nonstopmode", "-halt-on-error", "-output-directory=build", "main.tex"], cwd=paper_dir, timeout_s=timeout_s))
+
+        # Rerun until the aux/bbl files reach a fixed point, capped at two
+        # more passes; a further pass cannot change the output once the
+        # digest is stable.
+        prev_digest = _aux_digest(build_dir)
+        for pass_no in (2, 3):
+            logger.info(f"Running pdflatex (pass {pass_no})")
+            steps.append(_run_cmd(pdflatex_args, cwd=paper_dir, timeout_s=timeout_s))
+            digest = _aux_digest(build_dir)
+            if prev_digest is not None and digest == prev_digest:
+                logger.info(f"Aux files converged after pass {pass_no}; stopping reruns")
+                break
+            prev_digest = digest
     
     # Check compilation success
     ok = all(bool(s.get("ok")) for s in steps) if steps else False
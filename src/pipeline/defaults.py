@@ -25,22 +25,7 @@ class GateMode(str, Enum):
     SKIP = "skip"      # Skip the gate entirely
 
 
-def default_gate_config(mode: str = "warn") -> Dict[str, Dict[str, Any]]:
-    """Return default gate configurations.
-
-    Args:
-        mode: Default mode for all gates. One of "warn", "block", or "skip".
-              Default is "warn" which enables gates in degradation mode.
-              
-    Returns:
-        Dict of gate configurations.
-        
-    By default, gates are enabled in 'warn' mode (downgrade on failure).
-    This ensures issues are surfaced without blocking the pipeline.
-    
-    To enable strict blocking mode:
-        config = default_gate_config(mode="block")
-    """
+def _build_gate_config(mode: str) -> Dict[str, Dict[str, Any]]:
     on_failure = "block" if mode == "block" else "downgrade"
     enabled = mode != "skip"
     
@@ -77,3 +62,34 @@ def default_gate_config(mode: str = "warn") -> Dict[str, Dict[str, Any]]:
             "on_failure": on_failure,
         },
     }
+
+
+# The three possible outputs are pure functions of the mode; build them once.
+# Sub-dicts stay plain dicts (not read-only views) because gate config
+# parsers check isinstance(raw, dict).
+_PRECOMPUTED: Dict[str, Dict[str, Dict[str, Any]]] = {
+    m: _build_gate_config(m) for m in ("warn", "block", "skip")
+}
+
+
+def default_gate_config(mode: str = "warn") -> Dict[str, Dict[str, Any]]:
+    """Return default gate configurations.
+
+    Args:
+        mode: Default mode for all gates. One of "warn", "block", or "skip".
+              Default is "warn" which enables gates in degradation mode.
+
+    Returns:
+        Dict of gate configurations.
+
+    By default, gates are enabled in 'warn' mode (downgrade on failure).
+    This ensures issues are surfaced without blocking the pipeline.
+
+    To enable strict blocking mode:
+        config = default_gate_config(mode="block")
+    """
+    template = _PRECOMPUTED.get(mode)
+    if template is None:
+        return _build_gate_config(mode)
+    # Shallow-copy each flat sub-dict so callers may still mutate their view.
+    return {gate: dict(cfg) for gate, cfg in template.items()}
@@ -13,14 +13,12 @@ for more information see: https://giatenica.com
 import atexit
 import json
 import os
+import socket
 from typing import Any, Mapping, Optional
+from urllib.parse import urlparse
 
+from loguru import logger
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource, SERVICE_NAME
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 
 from src.config import TRACING
 
@@ -29,8 +27,8 @@ SERVICE_NAME_VALUE = TRACING.SERVICE_NAME
 OTLP_ENDPOINT = TRACING.OTLP_ENDPOINT
 ENABLE_TRACING = TRACING.ENABLED
 
-# Track provider for cleanup
-_provider: Optional[TracerProvider] = None
+# Track provider for cleanup (a TracerProvider once setup_tracing ran)
+_provider: Optional[Any] = None
 
 
 def _cleanup_tracing() -> None:
@@ -38,11 +36,28 @@ def _cleanup_tracing() -> None:
     global _provider
     if _provider is not None:
         try:
+            # Bounded flush first so the exit hook cannot block indefinitely
+            # on an unreachable collector.
+            _provider.force_flush(timeout_millis=5000)
             _provider.shutdown()
         except Exception:
             pass  # Best effort cleanup
 
 
+def _endpoint_reachable(endpoint: str, timeout_s: float = 0.2) -> bool:
+    """Quick TCP probe of the OTLP endpoint host/port."""
+    try:
+        parsed = urlparse(endpoint)
+        host = parsed.hostname
+        if not host:
+            return False
+        port = parsed.port or (443 if parsed.scheme == "https" else 4318)
+        with socket.create_connection((host, port), timeout=timeout_s):
+            return True
+    except OSError:
+        return False
+
+
 def setup_tracing(service_name: str = SERVICE_NAME_VALUE) -> trace.Tracer:
     """
     Initialize OpenTelemetry tracing with OTLP export.
@@ -54,7 +69,20 @@ def setup_tracing(service_name: str = SERVICE_NAME_VALUE) -> trace.Tracer:
         Configured tracer instance
     """
     global _provider
-    
+
+    # Imported lazily so the disabled-tracing path never pays for loading
+    # the SDK, exporter, and instrumentation stacks; only the lightweight
+    # opentelemetry.trace API is imported at module level.
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    # Bound per-span memory; read by the SDK when the provider is created.
+    os.environ.setdefault("OTEL_SPAN_ATTRIBUTE_COUNT_LIMIT", "128")
+    os.environ.setdefault("OTEL_SPAN_EVENT_COUNT_LIMIT", "128")
+
     # Create resource with service name
     resource = Resource.create({
         SERVICE_NAME: service_name,
@@ -68,14 +96,29 @@ def setup_tracing(service_name: str = SERVICE_NAME_VALUE) -> trace.Tracer:
         endpoint=OTLP_ENDPOINT,
     )
     
-    # Add batch processor for efficient export
-    _provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
+    # Add batch processor for efficient export, tuned for fewer and larger
+    # exports than the library defaults (queue 2048, 5s delay, batch 512);
+    # agent runs emit many short spans and amortize poorly otherwise.
+    _provider.add_span_processor(
+        BatchSpanProcessor(
+            otlp_exporter,
+            max_queue_size=8192,
+            schedule_delay_millis=30000,
+            max_export_batch_size=2048,
+            export_timeout_millis=15000,
+        )
+    )
     
     # Set as global tracer provider
     trace.set_tracer_provider(_provider)
     
-    # Instrument HTTP clients (for Anthropic API calls)
-    HTTPXClientInstrumentor().instrument()
+    # Instrument HTTP clients (for Anthropic API calls) only when per-request
+    # wrapping is wanted and the collector is actually reachable; otherwise
+    # every HTTPX call would pay span-creation overhead for dropped spans.
+    if TRACING.INSTRUMENT_HTTPX and _endpoint_reachable(OTLP_ENDPOINT):
+        HTTPXClientInstrumentor().instrument()
+    else:
+        logger.warning("Skipping HTTPX instrumentation (disabled via config or OTLP endpoint unreachable)")
     
     # Register cleanup on exit to flush pending spans
     atexit.register(_cleanup_tracing)
@@ -10,6 +10,14 @@ for more information see: https://giatenica.com
 
 from __future__ import annotations
 
+import string
+
+_KEEP = frozenset(string.ascii_letters + string.digits + "-_.")
+
+# Translation table for the ASCII fast path: maps every disallowed
+# codepoint below 128 to '_' so str.translate runs the whole scan in C.
+_ASCII_TRANSLATE = {b: (b if chr(b) in _KEEP else ord("_")) for b in range(128)}
+
 
 def validate_source_id(source_id: str) -> None:
     if not source_id or not isinstance(source_id, str):
@@ -28,9 +36,15 @@ def source_id_to_dirname(source_id: str) -> str:
     - Replaces other characters with '_'
     - Ensures a non-empty result
     """
+    if source_id.isascii():
+        dirname = source_id.translate(_ASCII_TRANSLATE).strip("_")
+        return dirname or "source"
+
+    # Unicode branch: str.isalnum() semantics matter here, so keep the
+    # per-character scan for non-ASCII identifiers.
     safe: list[str] = []
     for ch in source_id:
-        if ch.isalnum() or ch in {"-", "_", "."}:
+        if ch.isalnum() or ch in _KEEP:
             safe.append(ch)
         else:
             safe.append("_")
@@ -1,4 +1,4 @@
-""" 
+"""
 Project IO Utilities
 ====================
 Helpers for reading project metadata safely.
@@ -10,10 +10,31 @@ for more information see: https://giatenica.com
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    """Parse a project.json file, memoized on (path, mtime, size).
+
+    The stat fields key the cache so edits invalidate stale entries; on the
+    warm path repeated loads cost a single stat call.
+    """
+    raw = Path(path_str).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def load_project_json(project_folder: str) -> Dict[str, Any]:
     """Load a project's project.json safely.
@@ -21,15 +42,15 @@ def load_project_json(project_folder: str) -> Dict[str, Any]:
     Returns an empty dict when project.json is missing or unreadable.
     """
     project_json_path = Path(project_folder) / "project.json"
-    if not project_json_path.exists():
-        return {}
-
     try:
-        with open(project_json_path, "r") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else {}
-    except (json.JSONDecodeError, IOError, OSError):
+        st = os.stat(project_json_path)
+        data = _load_cached(str(project_json_path), st.st_mtime_ns, st.st_size)
+    except (ValueError, OSError):
         return {}
+    # Deep copy so callers cannot mutate the cached parse, including
+    # nested lists and dicts. project.json is small, so the copy is cheap
+    # next to the parse the stat-keyed cache avoids.
+    return copy.deepcopy(data) if isinstance(data, dict) else {}
 
 
 def get_project_id(project_folder: str) -> str:
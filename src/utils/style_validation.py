@@ -13,14 +13,23 @@ Author: Gia Tenica*
 for more information see: https://giatenica.com
 """
 
+import bisect
+import hashlib
 import re
-from typing import Dict, List, Optional, Tuple
+import sys
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
 from loguru import logger
 
 from src.agents.best_practices import BANNED_WORDS
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # =============================================================================
 # BANNED WORDS WITH REPLACEMENTS
@@ -133,6 +142,59 @@ BANNED_WORD_REPLACEMENTS: Dict[str, List[str]] = {
 }
 
 
+# Canonical (dictionary) form of each banned word keyed by lowercase form,
+# so matches found case-insensitively can be mapped back to replacement keys.
+_BANNED_CANONICAL: Dict[str, str] = {w.lower(): w for w in BANNED_WORDS}
+
+# Single alternation over all banned words, compiled once at import time.
+# Sorted longest-first so multi-word phrases like 'state-of-the-art' win
+# over any shorter banned word they contain.
+_BANNED_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(w) for w in sorted(BANNED_WORDS, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE,
+)
+
+
+# Optional Aho-Corasick automaton: scans the text in a single trie walk
+# instead of regex alternation stepping. Falls back to _BANNED_RE when
+# pyahocorasick is not installed.
+if ahocorasick is not None:
+    _BANNED_AC = ahocorasick.Automaton()
+    for _lower, _canonical in _BANNED_CANONICAL.items():
+        _BANNED_AC.add_word(_lower, _canonical)
+    _BANNED_AC.make_automaton()
+else:
+    _BANNED_AC = None
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+def _iter_banned(text: str) -> Iterator[Tuple[str, int, int]]:
+    """Yield (canonical_word, start, end) for each banned word occurrence."""
+    if _BANNED_AC is not None:
+        text_lower = text.lower()
+        text_len = len(text_lower)
+        for end_idx, word in _BANNED_AC.iter_long(text_lower):
+            start = end_idx - len(word) + 1
+            end = end_idx + 1
+            # Automaton matches are substring matches; enforce \b semantics.
+            if start > 0 and _is_word_char(text_lower[start - 1]):
+                continue
+            if end < text_len and _is_word_char(text_lower[end]):
+                continue
+            yield word, start, end
+    else:
+        for m in _BANNED_RE.finditer(text):
+            yield _BANNED_CANONICAL[m.group(1).lower()], m.start(), m.end()
+
+
+def find_banned(text: str) -> List[Tuple[str, int]]:
+    """Find banned words in text as (canonical_word, position) pairs."""
+    return [(word, start) for word, start, _end in _iter_banned(text)]
+
+
 # =============================================================================
 # WORD COUNT TARGETS FOR SHORT PAPERS
 # =============================================================================
@@ -162,7 +224,7 @@ WORDS_PER_PAGE: int = 250  # Standard academic estimate
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BannedWordMatch:
     """A single banned word found in text."""
     word: str
@@ -179,7 +241,7 @@ class BannedWordMatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionWordCount:
     """Word count for a specific section."""
     section_name: str
@@ -202,7 +264,7 @@ class SectionWordCount:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleValidationResult:
     """Complete result of style validation."""
     is_valid: bool
@@ -229,21 +291,19 @@ class StyleValidationResult:
 # SECTION DETECTION (LATEX-FOCUSED)
 # =============================================================================
 
-# Regex patterns for detecting sections in LaTeX
-LATEX_SECTION_PATTERNS = [
-    # \section{Title} or \section*{Title}
-    r'\\section\*?\{([^}]+)\}',
-    # \subsection{Title}
-    r'\\subsection\*?\{([^}]+)\}',
-]
-
-# Regex patterns for detecting sections in Markdown/plain text
-MARKDOWN_SECTION_PATTERNS = [
-    # # Title or ## Title
-    r'^#{1,2}\s+(.+)$',
-    # **Title** at start of line
-    r'^\*\*([^*]+)\*\*$',
-]
+# \section{Title}, \section*{Title}, or \subsection{Title} in one pattern,
+# so detection is a single scan yielding markers already in text order.
+_LATEX_SECTION_RE = re.compile(r'\\(?:sub)?section\*?\{([^}]+)\}')
+
+# '# Title', '## Title', or a line that is just '**Title**'
+_MARKDOWN_SECTION_RE = re.compile(r'^(?:#{1,2}\s+(.+)|\*\*([^*]+)\*\*)$', re.MULTILINE)
+
+# LaTeX markers combined into one precompiled alternation; these commands
+# appear in the preamble or first sections, so scanning the head suffices.
+_LATEX_INDICATOR_RE = re.compile(
+    r'\\documentclass|\\begin\{document\}|\\section|\\usepackage|\\maketitle'
+)
+_LATEX_SNIFF_CHARS = 4096
 
 # Known section name variations (normalized to lowercase)
 SECTION_ALIASES: Dict[str, str] = {
@@ -263,10 +323,31 @@ SECTION_ALIASES: Dict[str, str] = {
 }
 
 
+# Merged lookups precomputed from the two public tables above. Canonical
+# names map to themselves and aliases to their canonical form, so
+# normalization is a single dict probe instead of an alias get chained
+# with a fallback; targets are keyed by canonical and alias names alike.
+# Values are interned: section names recur across validations, and interned
+# strings make the repeated dict probes pointer comparisons.
+_CANONICAL_NAMES: Dict[str, str] = {
+    name: sys.intern(name) for name in SECTION_WORD_TARGETS
+}
+_CANONICAL_NAMES.update(
+    (alias, sys.intern(canonical)) for alias, canonical in SECTION_ALIASES.items()
+)
+
+_NORMALIZED_TARGETS: Dict[str, Tuple[int, int]] = dict(SECTION_WORD_TARGETS)
+_NORMALIZED_TARGETS.update(
+    (alias, SECTION_WORD_TARGETS[canonical])
+    for alias, canonical in SECTION_ALIASES.items()
+    if canonical in SECTION_WORD_TARGETS
+)
+
+
 def normalize_section_name(name: str) -> str:
     """Normalize section name for matching against targets."""
     name = name.lower().strip()
-    return SECTION_ALIASES.get(name, name)
+    return _CANONICAL_NAMES.get(name, name)
 
 
 def detect_sections_latex(text: str) -> List[Tuple[str, int, int]]:
@@ -277,16 +358,10 @@ def detect_sections_latex(text: str) -> List[Tuple[str, int, int]]:
         List of (section_name, start_pos, end_pos) tuples
     """
     sections = []
-    
-    # Find all section markers
-    markers = []
-    for pattern in LATEX_SECTION_PATTERNS:
-        for match in re.finditer(pattern, text, re.MULTILINE):
-            markers.append((match.start(), match.group(1)))
-    
-    # Sort by position
-    markers.sort(key=lambda x: x[0])
-    
+
+    # One scan; finditer yields markers in text order, so no sort is needed
+    markers = [(m.start(), m.group(1)) for m in _LATEX_SECTION_RE.finditer(text)]
+
     # Create sections with boundaries
     for i, (pos, name) in enumerate(markers):
         end_pos = markers[i + 1][0] if i + 1 < len(markers) else len(text)
@@ -303,14 +378,11 @@ def detect_sections_markdown(text: str) -> List[Tuple[str, int, int]]:
         List of (section_name, start_pos, end_pos) tuples
     """
     sections = []
-    markers = []
-    
-    for pattern in MARKDOWN_SECTION_PATTERNS:
-        for match in re.finditer(pattern, text, re.MULTILINE):
-            markers.append((match.start(), match.group(1)))
-    
-    markers.sort(key=lambda x: x[0])
-    
+    markers = [
+        (m.start(), m.group(1) or m.group(2))
+        for m in _MARKDOWN_SECTION_RE.finditer(text)
+    ]
+
     for i, (pos, name) in enumerate(markers):
         end_pos = markers[i + 1][0] if i + 1 < len(markers) else len(text)
         sections.append((normalize_section_name(name), pos, end_pos))
@@ -320,14 +392,7 @@ def detect_sections_markdown(text: str) -> List[Tuple[str, int, int]]:
 
 def is_latex_document(text: str) -> bool:
     """Check if text appears to be LaTeX."""
-    latex_indicators = [
-        r'\\documentclass',
-        r'\\begin\{document\}',
-        r'\\section',
-        r'\\usepackage',
-        r'\\maketitle',
-    ]
-    return any(re.search(p, text) for p in latex_indicators)
+    return _LATEX_INDICATOR_RE.search(text, 0, _LATEX_SNIFF_CHARS) is not None
 
 
 # =============================================================================
@@ -349,61 +414,57 @@ def check_banned_words(
         List of BannedWordMatch objects for each occurrence
     """
     matches = []
-    text_lower = text.lower()
-    
-    for word in BANNED_WORDS:
-        # Create pattern that matches whole words only
-        # Handle hyphenated words specially
-        if '-' in word:
-            pattern = re.escape(word)
-        else:
-            pattern = r'\b' + re.escape(word) + r'\b'
-        
-        for match in re.finditer(pattern, text_lower, re.IGNORECASE):
-            start = match.start()
-            end = match.end()
-            
-            # Extract context
-            ctx_start = max(0, start - context_chars)
-            ctx_end = min(len(text), end + context_chars)
-            context = text[ctx_start:ctx_end]
-            if ctx_start > 0:
-                context = '...' + context
-            if ctx_end < len(text):
-                context = context + '...'
-            
-            # Get replacements
-            replacements = BANNED_WORD_REPLACEMENTS.get(word, ['[consider rephrasing]'])
-            
-            matches.append(BannedWordMatch(
-                word=word,
-                location=start,
-                context=context,
-                replacements=replacements,
-            ))
-    
+    text_len = len(text)
+
+    for word, start, end in _iter_banned(text):
+        # Extract context
+        ctx_start = max(0, start - context_chars)
+        ctx_end = min(text_len, end + context_chars)
+        context = text[ctx_start:ctx_end]
+        if ctx_start > 0:
+            context = '...' + context
+        if ctx_end < text_len:
+            context = context + '...'
+
+        # Get replacements
+        replacements = BANNED_WORD_REPLACEMENTS.get(word, ['[consider rephrasing]'])
+
+        matches.append(BannedWordMatch(
+            word=word,
+            location=start,
+            context=context,
+            replacements=replacements,
+        ))
+
     return matches
 
 
+# One tokenizer pass: comments, LaTeX commands (with optional argument),
+# stray braces, and words. Non-word tokens are consumed without counting,
+# replacing the previous cascade of four full-text re.sub rewrites.
+_TOKEN_RE = re.compile(r'%[^\n]*|\\[a-zA-Z]+\*?(?:\{[^}]*\})?|[{}]|\w+')
+
+
 def count_words(text: str) -> int:
     """
     Count words in text, excluding LaTeX commands.
-    
+
     Args:
         text: Text to count
-        
+
     Returns:
         Word count
     """
-    # Remove LaTeX commands
-    clean = re.sub(r'\\[a-zA-Z]+\*?\{[^}]*\}', '', text)
-    clean = re.sub(r'\\[a-zA-Z]+\*?', '', clean)
-    clean = re.sub(r'\{|\}', '', clean)
-    clean = re.sub(r'%.*$', '', clean, flags=re.MULTILINE)  # Remove comments
-    
-    # Count words
-    words = re.findall(r'\b\w+\b', clean)
-    return len(words)
+    count = 0
+    for m in _TOKEN_RE.finditer(text):
+        if m.group(0)[0] not in '\\%{}':
+            count += 1
+    return count
+
+
+def _word_token_starts(text: str) -> List[int]:
+    """Start offsets of countable word tokens, from one tokenizer pass."""
+    return [m.start() for m in _TOKEN_RE.finditer(text) if m.group(0)[0] not in '\\%{}']
 
 
 def count_words_by_section(text: str) -> List[SectionWordCount]:
@@ -421,15 +482,22 @@ def count_words_by_section(text: str) -> List[SectionWordCount]:
         sections = detect_sections_latex(text)
     else:
         sections = detect_sections_markdown(text)
-    
+
+    return _count_sections(sections, _word_token_starts(text))
+
+
+def _count_sections(
+    sections: List[Tuple[str, int, int]],
+    token_starts: List[int],
+) -> List[SectionWordCount]:
+    """Derive per-section counts from document-wide word token offsets."""
     results = []
-    
+
     for section_name, start, end in sections:
-        section_text = text[start:end]
-        word_count = count_words(section_text)
-        
-        # Get target range if known
-        target = SECTION_WORD_TARGETS.get(section_name)
+        word_count = bisect.bisect_left(token_starts, end) - bisect.bisect_left(token_starts, start)
+
+        # Get target range if known (alias keys resolve directly)
+        target = _NORMALIZED_TARGETS.get(section_name)
         if target:
             target_min, target_max = target
             if word_count < target_min:
@@ -517,6 +585,12 @@ def validate_word_counts(
 # MAIN VALIDATION FUNCTION
 # =============================================================================
 
+# Bounded LRU of validation results keyed by content digest plus flags;
+# drafts are typically validated several times between edits.
+_VALIDATE_CACHE: "OrderedDict[bytes, StyleValidationResult]" = OrderedDict()
+_VALIDATE_CACHE_MAX = 128
+
+
 def validate_style(
     text: str,
     check_words: bool = True,
@@ -535,13 +609,32 @@ def validate_style(
         is_final_output: Whether this is final LaTeX output (affects validation strictness)
         
     Returns:
-        StyleValidationResult with all findings
+        StyleValidationResult with all findings. Results are cached per
+        (text, flags) and shared between callers; treat them as read-only.
     """
+    cache_key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() + bytes(
+        (check_words, check_counts, is_final_output)
+    )
+    cached = _VALIDATE_CACHE.get(cache_key)
+    if cached is not None:
+        _VALIDATE_CACHE.move_to_end(cache_key)
+        return cached
+
     issues = []
     suggestions = []
     banned_matches = []
     section_counts = []
-    total_words = count_words(text)
+    # Per-section counting needs the token start offsets; when it is skipped
+    # the total alone suffices, so avoid materializing the offsets list.
+    # total_words stays populated either way: callers such as StyleEnforcer
+    # report it and score against it regardless of the count flags.
+    need_section_counts = check_counts and is_final_output
+    if need_section_counts:
+        token_starts = _word_token_starts(text)
+        total_words = len(token_starts)
+    else:
+        token_starts = []
+        total_words = count_words(text)
     estimated_pages = estimate_page_count(total_words)
     
     # Check banned words
@@ -555,8 +648,9 @@ def validate_style(
                 )
     
     # Check word counts (only for final output)
-    if check_counts and is_final_output:
-        section_counts = count_words_by_section(text)
+    if need_section_counts:
+        sections = detect_sections_latex(text) if is_latex_document(text) else detect_sections_markdown(text)
+        section_counts = _count_sections(sections, token_starts)
         count_issues, count_suggestions = validate_word_counts(
             section_counts, total_words
         )
@@ -568,7 +662,7 @@ def validate_style(
     # Word count issues are warnings
     is_valid = len([i for i in issues if 'Banned word' not in i]) == 0
     
-    return StyleValidationResult(
+    result = StyleValidationResult(
         is_valid=is_valid,
         banned_words=banned_matches,
         section_counts=section_counts,
@@ -578,6 +672,11 @@ def validate_style(
         suggestions=suggestions,
     )
 
+    _VALIDATE_CACHE[cache_key] = result
+    if len(_VALIDATE_CACHE) > _VALIDATE_CACHE_MAX:
+        _VALIDATE_CACHE.popitem(last=False)
+    return result
+
 
 def suggest_replacement(text: str, word: str) -> Optional[str]:
     """
@@ -608,36 +707,25 @@ def auto_replace_banned_words(text: str) -> Tuple[str, List[Tuple[str, str, str]
     Returns:
         Tuple of (modified_text, list of (original, replacement, context))
     """
-    replacements_made = []
-    result = text
-    
-    for word in BANNED_WORDS:
-        if '-' in word:
-            pattern = re.escape(word)
-        else:
-            pattern = r'\b' + re.escape(word) + r'\b'
-        
-        replacement = suggest_replacement(text, word)
-        if not replacement:
-            continue
-        
-        def replace_match(match):
-            original = match.group(0)
-            # Preserve case
-            if original.isupper():
-                return replacement.upper()
-            elif original[0].isupper():
-                return replacement.capitalize()
-            return replacement
-        
-        # Find matches before replacing
-        for match in re.finditer(pattern, result, re.IGNORECASE):
-            start = max(0, match.start() - 30)
-            end = min(len(result), match.end() + 30)
-            context = result[start:end]
-            replacements_made.append((match.group(0), replacement, context))
-        
-        # Perform replacement
-        result = re.sub(pattern, replace_match, result, flags=re.IGNORECASE)
-    
-    return result, replacements_made
+    replacements_made: List[Tuple[str, str, str]] = []
+    text_len = len(text)
+
+    def _dispatch(match):
+        original = match.group(0)
+        word = _BANNED_CANONICAL.get(original.lower())
+        replacements = BANNED_WORD_REPLACEMENTS.get(word) if word else None
+        if not replacements:
+            return original
+        replacement = replacements[0]
+
+        context = text[max(0, match.start() - 30):min(text_len, match.end() + 30)]
+        replacements_made.append((original, replacement, context))
+
+        # Preserve case
+        if original.isupper():
+            return replacement.upper()
+        if original[0].isupper():
+            return replacement.capitalize()
+        return replacement
+
+    return _BANNED_RE.sub(_dispatch, text), replacements_made
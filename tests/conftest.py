@@ -14,7 +14,7 @@ import json
 import pytest
 import asyncio
 from pathlib import Path
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, MagicMock, patch
 from dataclasses import dataclass
 
 # Add project root to path
@@ -22,6 +22,30 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 
+# =============================================================================
+# Fixtures: Patched Anthropic SDK
+# =============================================================================
+
+@pytest.fixture
+def mocked_anthropic(monkeypatch):
+    """Patch the Anthropic SDK classes and provide a test API key.
+
+    Replaces the three-decorator stack of @patch.dict(os.environ) plus
+    @patch on Anthropic/AsyncAnthropic that client and agent tests used
+    to repeat; one monkeypatch per test is cheaper than re-resolving the
+    patch targets for every decorator application.
+
+    Returns:
+        Tuple of (sync_mock, async_mock) class mocks.
+    """
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    sync_mock = MagicMock()
+    async_mock = MagicMock()
+    monkeypatch.setattr("src.llm.claude_client.anthropic.Anthropic", sync_mock)
+    monkeypatch.setattr("src.llm.claude_client.anthropic.AsyncAnthropic", async_mock)
+    return sync_mock, async_mock
+
+
 # =============================================================================
 # Fixtures: Mock Claude Client
 # =============================================================================
@@ -176,3 +200,16 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "unit: Unit tests without external deps")
     config.addinivalue_line("markers", "integration: Tests requiring API keys")
     config.addinivalue_line("markers", "slow: Slow running tests")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Default unmarked tests to the unit suite.
+
+    Tests without an explicit unit/integration/slow marker are fully
+    mocked, so `-m unit` should select them instead of silently skipping
+    them.
+    """
+    suite_markers = ("unit", "integration", "slow")
+    for item in items:
+        if not any(item.get_closest_marker(name) for name in suite_markers):
+            item.add_marker(pytest.mark.unit)
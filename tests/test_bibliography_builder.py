@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import json
-import tempfile
 from pathlib import Path
-from typing import Iterator
 
 import pytest
 
@@ -17,14 +16,34 @@ from src.citations.bibliography import (
 from src.citations.registry import load_citations, make_minimal_citation_record, save_citations
 
 
+# One schema-valid template, validated once; _record deep-copies it and
+# overrides fields, so the per-test jsonschema validation cost inside
+# make_minimal_citation_record is paid a single time per module.
+_RECORD_TEMPLATE = make_minimal_citation_record(
+    citation_key="Template",
+    title="T",
+    authors=["A"],
+    year=2001,
+    identifiers={"doi": "10.0000/template"},
+    created_at="2025-01-01T00:00:00Z",
+)
+
+
+def _record(**overrides):
+    rec = copy.deepcopy(_RECORD_TEMPLATE)
+    rec.update(overrides)
+    return rec
+
+
 @pytest.fixture
-def temp_project_folder() -> Iterator[str]:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        (Path(tmpdir) / "project.json").write_text(
-            json.dumps({"id": "p1", "title": "t", "research_question": "q"}),
-            encoding="utf-8",
-        )
-        yield tmpdir
+def temp_project_folder(tmp_path: Path) -> str:
+    # tmp_path is per-test and cleaned up lazily by pytest, which is cheaper
+    # than a TemporaryDirectory context manager torn down after every test.
+    (tmp_path / "project.json").write_text(
+        json.dumps({"id": "p1", "title": "t", "research_question": "q"}),
+        encoding="utf-8",
+    )
+    return str(tmp_path)
 
 
 @pytest.mark.unit
@@ -52,7 +71,7 @@ def test_mint_stable_citation_key_suffixes_beyond_z():
 
 @pytest.mark.unit
 def test_dedupe_by_doi_keeps_one_record_and_maps_dropped():
-    rec1 = make_minimal_citation_record(
+    rec1 = _record(
         citation_key="Key1",
         title="T1",
         authors=["A"],
@@ -60,7 +79,7 @@ def test_dedupe_by_doi_keeps_one_record_and_maps_dropped():
         identifiers={"doi": "10.1234/abcd"},
         status="verified",
     )
-    rec2 = make_minimal_citation_record(
+    rec2 = _record(
         citation_key="Key2",
         title="T2",
         authors=["B"],
@@ -78,7 +97,7 @@ def test_dedupe_by_doi_keeps_one_record_and_maps_dropped():
 def test_dedupe_by_doi_merges_missing_fields_into_kept_record():
     # Kept record should be the verified one, but it should receive missing fields
     # from the dropped record.
-    kept = make_minimal_citation_record(
+    kept = _record(
         citation_key="Keep",
         title="T",
         authors=["A"],
@@ -86,7 +105,7 @@ def test_dedupe_by_doi_merges_missing_fields_into_kept_record():
         identifiers={"doi": "10.1000/merge"},
         status="verified",
     )
-    dropped = make_minimal_citation_record(
+    dropped = _record(
         citation_key="Drop",
         title="T",
         authors=["A"],
@@ -107,7 +126,7 @@ def test_dedupe_by_doi_merges_missing_fields_into_kept_record():
 
 @pytest.mark.unit
 def test_build_bibliography_writes_bib_and_updates_registry(temp_project_folder: str):
-    rec1 = make_minimal_citation_record(
+    rec1 = _record(
         citation_key="KeyA",
         title="T1",
         authors=["Alice A"],
@@ -115,7 +134,7 @@ def test_build_bibliography_writes_bib_and_updates_registry(temp_project_folder:
         identifiers={"doi": "10.5555/xyz"},
         status="unverified",
     )
-    rec2 = make_minimal_citation_record(
+    rec2 = _record(
         citation_key="KeyB",
         title="T2",
         authors=["Bob B"],
@@ -149,7 +168,7 @@ def test_build_bibliography_writes_bib_and_updates_registry(temp_project_folder:
 
 @pytest.mark.unit
 def test_build_bibliography_can_prefer_published_version_for_working_paper_key(temp_project_folder: str):
-    wp = make_minimal_citation_record(
+    wp = _record(
         citation_key="KeyWP",
         title="Working Paper Title",
         authors=["Alice A"],
@@ -159,7 +178,7 @@ def test_build_bibliography_can_prefer_published_version_for_working_paper_key(t
     )
     wp["version"] = {"type": "working_paper", "related_published": "10.5555/pub"}
 
-    pub = make_minimal_citation_record(
+    pub = _record(
         citation_key="KeyPUB",
         title="Published Title",
         authors=["Alice A"],
@@ -13,8 +13,10 @@ from src.evidence.store import EvidenceStore
 
 def _write_claims(project_folder, claims):
     (project_folder / "claims").mkdir(exist_ok=True)
+    # Compact separators: the gate only parses this file, nobody reads it,
+    # and skipping indent/sort keeps the encoder on its fast path.
     (project_folder / "claims" / "claims.json").write_text(
-        json.dumps(claims, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+        json.dumps(claims, ensure_ascii=False, separators=(",", ":")) + "\n",
         encoding="utf-8",
     )
 
@@ -19,16 +19,23 @@ def _iso(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+# Frozen instant shared by every test; staleness math works off explicit
+# timedelta offsets, so one constant replaces per-test datetime construction
+# and repeated _iso formatting.
+_FROZEN_NOW = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
+_FROZEN_NOW_ISO = _iso(_FROZEN_NOW)
+
+
 @pytest.mark.unit
 def test_is_verification_stale_true_when_missing_or_unparseable():
     policy = CitationVerificationPolicy(max_age_hours=24)
-    assert is_verification_stale(last_checked=None, now=_iso(datetime.now(timezone.utc)), policy=policy) is True
-    assert is_verification_stale(last_checked="not-a-date", now=_iso(datetime.now(timezone.utc)), policy=policy) is True
+    assert is_verification_stale(last_checked=None, now=_FROZEN_NOW_ISO, policy=policy) is True
+    assert is_verification_stale(last_checked="not-a-date", now=_FROZEN_NOW_ISO, policy=policy) is True
 
 
 @pytest.mark.unit
 def test_is_verification_stale_respects_max_age_hours():
-    now = datetime.now(timezone.utc)
+    now = _FROZEN_NOW
     policy = CitationVerificationPolicy(max_age_hours=24)
 
     fresh = _iso(now - timedelta(hours=1))
@@ -56,10 +63,12 @@ def test_verification_falls_back_to_openalex_when_crossref_fails():
         )
         return rec
 
-    with patch("src.citations.verification.resolve_crossref_doi_to_record", boom), patch(
-        "src.citations.verification.resolve_openalex_doi_to_record", ok_openalex
+    with patch.multiple(
+        "src.citations.verification",
+        resolve_crossref_doi_to_record=boom,
+        resolve_openalex_doi_to_record=ok_openalex,
     ):
-        rec = resolve_doi_to_record_with_fallback(doi=doi, citation_key="K", created_at=_iso(datetime.now(timezone.utc)))
+        rec = resolve_doi_to_record_with_fallback(doi=doi, citation_key="K", created_at=_FROZEN_NOW_ISO)
 
     assert rec["status"] == "verified"
     assert rec["verification"]["provider_used"] == "openalex"
@@ -90,9 +99,11 @@ def test_verification_uses_crossref_when_it_succeeds():
     def should_not_be_called(*args, **kwargs):
         raise AssertionError("OpenAlex fallback should not be called")
 
-    now = datetime.now(timezone.utc)
-    with patch("src.citations.verification.resolve_crossref_doi_to_record", ok_crossref), patch(
-        "src.citations.verification.resolve_openalex_doi_to_record", should_not_be_called
+    now = _FROZEN_NOW
+    with patch.multiple(
+        "src.citations.verification",
+        resolve_crossref_doi_to_record=ok_crossref,
+        resolve_openalex_doi_to_record=should_not_be_called,
     ):
         rec = resolve_doi_to_record_with_fallback(doi=doi, citation_key="K", created_at=_iso(now), now=_iso(now))
 
@@ -111,9 +122,11 @@ def test_verification_returns_manual_record_when_both_providers_fail():
     def boom(*args, **kwargs):
         raise RuntimeError("down")
 
-    now = datetime.now(timezone.utc)
-    with patch("src.citations.verification.resolve_crossref_doi_to_record", boom), patch(
-        "src.citations.verification.resolve_openalex_doi_to_record", boom
+    now = _FROZEN_NOW
+    with patch.multiple(
+        "src.citations.verification",
+        resolve_crossref_doi_to_record=boom,
+        resolve_openalex_doi_to_record=boom,
     ):
         rec = resolve_doi_to_record_with_fallback(doi=doi, citation_key="K", created_at=_iso(now), now=_iso(now))
 
@@ -130,7 +143,7 @@ def test_verification_returns_manual_record_when_both_providers_fail():
 
 @pytest.mark.unit
 def test_verification_reuses_fresh_existing_verified_record():
-    now = datetime.now(timezone.utc)
+    now = _FROZEN_NOW
     doi = "10.1000/182"
 
     existing = make_minimal_citation_record(
@@ -152,8 +165,10 @@ def test_verification_reuses_fresh_existing_verified_record():
     def should_not_be_called(*args, **kwargs):
         raise AssertionError("Network resolver should not be called")
 
-    with patch("src.citations.verification.resolve_crossref_doi_to_record", should_not_be_called), patch(
-        "src.citations.verification.resolve_openalex_doi_to_record", should_not_be_called
+    with patch.multiple(
+        "src.citations.verification",
+        resolve_crossref_doi_to_record=should_not_be_called,
+        resolve_openalex_doi_to_record=should_not_be_called,
     ):
         rec = resolve_doi_to_record_with_fallback(
             doi=doi,
@@ -169,7 +184,7 @@ def test_verification_reuses_fresh_existing_verified_record():
 
 @pytest.mark.unit
 def test_verification_does_not_reuse_verified_record_with_different_doi():
-    now = datetime.now(timezone.utc)
+    now = _FROZEN_NOW
     doi = "10.1000/182"
 
     existing = make_minimal_citation_record(
@@ -17,6 +17,24 @@ from src.llm.claude_literature_search import (
 )
 
 
+def _configure_chat_async(mock_client, responses):
+    """Drive a mocked client's chat_async with canned (content, tokens) pairs.
+
+    Token counts accumulate on usage.total_tokens the way the real client
+    records usage, so _llm_complete sees the expected per-call deltas. The
+    last response is reused once the queue is exhausted.
+    """
+    queue = list(responses)
+
+    async def _chat_async(**kwargs):
+        content, tokens = queue.pop(0) if len(queue) > 1 else queue[0]
+        mock_client.usage.total_tokens += tokens
+        return content
+
+    mock_client.usage.total_tokens = 0
+    mock_client.chat_async = AsyncMock(side_effect=_chat_async)
+
+
 class TestLiteratureSearchConfig:
     """Test LiteratureSearchConfig dataclass."""
     
@@ -130,7 +148,7 @@ class TestClaudeLiteratureSearch:
     def mock_claude_client(self):
         """Create mock Claude client."""
         mock = MagicMock()
-        mock.complete = AsyncMock()
+        mock.usage.total_tokens = 0
         return mock
     
     @pytest.fixture
@@ -166,51 +184,36 @@ class TestClaudeLiteratureSearch:
     async def test_search_returns_result(self, search, mock_claude_client, mock_s2_client, mock_openalex_client):
         """Test that search returns a ClaudeLiteratureSearchResult."""
         # Mock query decomposition
-        mock_claude_client.complete.side_effect = [
+        _configure_chat_async(mock_claude_client, [
             # Query decomposition response
-            MagicMock(
-                content=json.dumps({
-                    "aspect_queries": [
-                        {"aspect": "main", "query": "test query", "rationale": "test"}
-                    ],
-                    "key_terms": ["term1"],
-                }),
-                usage=MagicMock(total_tokens=100),
-            ),
+            (json.dumps({
+                "aspect_queries": [
+                    {"aspect": "main", "query": "test query", "rationale": "test"}
+                ],
+                "key_terms": ["term1"],
+            }), 100),
             # Paper evaluation responses
-            MagicMock(
-                content=json.dumps({
-                    "relevance_score": 8.0,
-                    "relevance_rationale": "Very relevant",
-                    "key_findings": ["finding1"],
-                    "citable_claims": [],
-                }),
-                usage=MagicMock(total_tokens=200),
-            ),
-            MagicMock(
-                content=json.dumps({
-                    "relevance_score": 6.0,
-                    "relevance_rationale": "Moderately relevant",
-                    "key_findings": ["finding2"],
-                    "citable_claims": [],
-                }),
-                usage=MagicMock(total_tokens=200),
-            ),
+            (json.dumps({
+                "relevance_score": 8.0,
+                "relevance_rationale": "Very relevant",
+                "key_findings": ["finding1"],
+                "citable_claims": [],
+            }), 200),
+            (json.dumps({
+                "relevance_score": 6.0,
+                "relevance_rationale": "Moderately relevant",
+                "key_findings": ["finding2"],
+                "citable_claims": [],
+            }), 200),
             # Synthesis response
-            MagicMock(
-                content=json.dumps({
-                    "evidence_for_hypothesis": [],
-                    "evidence_against_hypothesis": [],
-                    "synthesis_narrative": "Synthesis text",
-                }),
-                usage=MagicMock(total_tokens=300),
-            ),
+            (json.dumps({
+                "evidence_for_hypothesis": [],
+                "evidence_against_hypothesis": [],
+                "synthesis_narrative": "Synthesis text",
+            }), 300),
             # Literature review response
-            MagicMock(
-                content="This is the literature review text.",
-                usage=MagicMock(total_tokens=400),
-            ),
-        ]
+            ("This is the literature review text.", 400),
+        ])
         
         # Mock Semantic Scholar results
         from src.llm.semantic_scholar_client import SemanticScholarPaper, SemanticScholarSearchResult
@@ -259,14 +262,13 @@ class TestClaudeLiteratureSearch:
     async def test_search_handles_no_papers(self, search, mock_claude_client, mock_s2_client, mock_openalex_client):
         """Test search handles case when no papers are found."""
         # Mock query decomposition
-        mock_claude_client.complete.return_value = MagicMock(
-            content=json.dumps({
+        _configure_chat_async(mock_claude_client, [
+            (json.dumps({
                 "aspect_queries": [
                     {"aspect": "main", "query": "test query", "rationale": "test"}
                 ],
-            }),
-            usage=MagicMock(total_tokens=100),
-        )
+            }), 100),
+        ])
         
         # Mock empty results from both sources
         from src.llm.semantic_scholar_client import SemanticScholarSearchResult
@@ -295,14 +297,13 @@ class TestClaudeLiteratureSearch:
     async def test_search_handles_api_errors(self, search, mock_claude_client, mock_s2_client, mock_openalex_client):
         """Test search handles API errors gracefully."""
         # Mock query decomposition
-        mock_claude_client.complete.return_value = MagicMock(
-            content=json.dumps({
+        _configure_chat_async(mock_claude_client, [
+            (json.dumps({
                 "aspect_queries": [
                     {"aspect": "main", "query": "test query", "rationale": "test"}
                 ],
-            }),
-            usage=MagicMock(total_tokens=100),
-        )
+            }), 100),
+        ])
         
         # Mock API errors
         mock_s2_client.search_papers.side_effect = Exception("API Error")
@@ -340,8 +341,8 @@ class TestQueryDecomposition:
     async def test_decompose_queries_parses_json(self):
         """Test that query decomposition parses JSON response."""
         mock_claude = MagicMock()
-        mock_claude.complete = AsyncMock(return_value=MagicMock(
-            content="""```json
+        _configure_chat_async(mock_claude, [
+            ("""```json
 {
     "aspect_queries": [
         {"aspect": "theoretical", "query": "voting premium theory", "rationale": "Find foundational work"},
@@ -350,9 +351,8 @@ class TestQueryDecomposition:
     "key_terms": ["voting premium", "dual-class"],
     "related_fields": ["corporate governance"]
 }
-```""",
-            usage=MagicMock(total_tokens=150),
-        ))
+```""", 150),
+        ])
         
         search = ClaudeLiteratureSearch(claude_client=mock_claude)
         
@@ -372,10 +372,7 @@ class TestQueryDecomposition:
     async def test_decompose_queries_handles_parse_error(self):
         """Test fallback when JSON parsing fails."""
         mock_claude = MagicMock()
-        mock_claude.complete = AsyncMock(return_value=MagicMock(
-            content="This is not valid JSON",
-            usage=MagicMock(total_tokens=50),
-        ))
+        _configure_chat_async(mock_claude, [("This is not valid JSON", 50)])
         
         search = ClaudeLiteratureSearch(claude_client=mock_claude)
         
@@ -455,8 +452,8 @@ class TestPaperEvaluation:
     async def test_evaluate_paper_parses_response(self):
         """Test that paper evaluation parses response correctly."""
         mock_claude = MagicMock()
-        mock_claude.complete = AsyncMock(return_value=MagicMock(
-            content=json.dumps({
+        _configure_chat_async(mock_claude, [
+            (json.dumps({
                 "relevance_score": 8.5,
                 "relevance_rationale": "Directly relevant to hypothesis",
                 "key_findings": ["Finding 1", "Finding 2"],
@@ -466,9 +463,8 @@ class TestPaperEvaluation:
                 "methodology": "Panel regression",
                 "limitations": ["Small sample"],
                 "citation_recommendation": "must-cite",
-            }),
-            usage=MagicMock(total_tokens=300),
-        ))
+            }), 300),
+        ])
         
         search = ClaudeLiteratureSearch(claude_client=mock_claude)
         
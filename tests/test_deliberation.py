@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 from src.agents.base import AgentResult
 from src.agents.deliberation import DeliberationPerspective, build_consensus, detect_conflict
@@ -13,35 +13,27 @@ def test_detect_conflict_flags_different_outputs():
 
 
 @pytest.mark.unit
-def test_build_consensus_marks_degraded_on_conflict():
+@pytest.mark.parametrize("contents, expect_conflict", [
+    pytest.param(("alpha", "beta"), True, id="conflicting-outputs"),
+    pytest.param(("same\n", "same"), False, id="equivalent-outputs"),
+])
+def test_build_consensus(contents, expect_conflict):
     perspectives = [
-        DeliberationPerspective(agent_id="A01", success=True, content="alpha", error=None, result=None),
-        DeliberationPerspective(agent_id="A02", success=True, content="beta", error=None, result=None),
+        DeliberationPerspective(agent_id=agent_id, success=True, content=content, error=None, result=None)
+        for agent_id, content in zip(("A01", "A02"), contents)
     ]
 
     out = build_consensus(task_text="t", agent_ids=["A01", "A02"], perspectives=perspectives)
-    assert out["conflict_detected"] is True
-    assert out["degraded"] is True
+    assert out["conflict_detected"] is expect_conflict
+    assert out["degraded"] is expect_conflict
     assert "rationale" in out
-    assert "consolidated_output" in out
-    assert "Perspective (A01)" in out["consolidated_output"]
+    if expect_conflict:
+        assert "Perspective (A01)" in out["consolidated_output"]
+    else:
+        assert out["consolidated_output"].strip() == "same"
 
 
 @pytest.mark.unit
-def test_build_consensus_not_degraded_when_equivalent_outputs():
-    perspectives = [
-        DeliberationPerspective(agent_id="A01", success=True, content="same\n", error=None, result=None),
-        DeliberationPerspective(agent_id="A02", success=True, content="same", error=None, result=None),
-    ]
-
-    out = build_consensus(task_text="t", agent_ids=["A01", "A02"], perspectives=perspectives)
-    assert out["conflict_detected"] is False
-    assert out["degraded"] is False
-    assert out["consolidated_output"].strip() == "same"
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
 @patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}, clear=True)
 async def test_orchestrator_deliberation_writes_artifact(tmp_path):
     (tmp_path / "project.json").write_text(
@@ -73,7 +65,9 @@ async def test_orchestrator_deliberation_writes_artifact(tmp_path):
                     timestamp="2025-12-27T00:00:00+00:00",
                 )
 
-            orch.execute_agent = AsyncMock(side_effect=_fake_execute_agent)
+            # No call assertions are made, so the coroutine is assigned
+            # directly instead of going through an AsyncMock wrapper.
+            orch.execute_agent = _fake_execute_agent
 
             result = await orch.execute_deliberation_and_consensus(
                 task_text="Do the thing",
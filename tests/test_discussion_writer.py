@@ -8,7 +8,6 @@ from src.citations.registry import make_minimal_citation_record, save_citations
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_discussion_writer_downgrades_on_missing_evidence(temp_project_folder):
     agent = DiscussionWriterAgent(client=None)
     ctx = {
@@ -69,7 +68,6 @@ def _write_metrics(project_folder, *, metrics):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_discussion_writer_blocks_on_missing_evidence_when_configured(temp_project_folder):
     agent = DiscussionWriterAgent(client=None)
     ctx = {"project_folder": str(temp_project_folder), "discussion_writer": {"on_missing_evidence": "block"}}
@@ -80,7 +78,6 @@ async def test_discussion_writer_blocks_on_missing_evidence_when_configured(temp
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_discussion_writer_blocks_on_missing_metrics_when_configured(temp_project_folder):
     _write_evidence_marker(temp_project_folder, "src_1")
     _write_claims(temp_project_folder, metric_keys=["m1"])
@@ -95,7 +92,6 @@ async def test_discussion_writer_blocks_on_missing_metrics_when_configured(temp_
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_discussion_writer_disabled_writes_section(temp_project_folder):
     agent = DiscussionWriterAgent(client=None)
     ctx = {"project_folder": str(temp_project_folder), "discussion_writer": {"enabled": False}}
@@ -108,7 +104,6 @@ async def test_discussion_writer_disabled_writes_section(temp_project_folder):
 
 
 @pytest.mark.unit
-@pytest.mark.asyncio
 async def test_discussion_writer_success_path_includes_metric_and_citation(temp_project_folder):
     _write_evidence_marker(temp_project_folder, "src_1")
     save_citations(
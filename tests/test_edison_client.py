@@ -315,6 +315,20 @@ class TestCitationModel:
         assert citation.title == "Test Paper"
         assert citation.year == 2023
     
+    @pytest.mark.unit
+    def test_citation_to_json_matches_to_dict(self):
+        """Citation.to_json should serialize the same payload as to_dict."""
+        import json
+
+        citation = Citation(
+            title="Test Paper",
+            authors=("Author One",),
+            year=2023,
+            doi="10.1000/test",
+        )
+
+        assert json.loads(citation.to_json()) == citation.to_dict()
+
     @pytest.mark.unit
     def test_citation_to_bibtex(self):
         """Citation.to_bibtex should generate valid BibTeX."""
@@ -356,6 +370,19 @@ class TestLiteratureResult:
         assert len(d['citations']) == 1
         assert d['status'] == "completed"
     
+    @pytest.mark.unit
+    def test_literature_result_to_json_matches_to_dict(self):
+        """LiteratureResult.to_json should serialize the same payload as to_dict."""
+        import json
+
+        result = LiteratureResult(
+            query="test query",
+            citations=[Citation(title="Test", authors=("Author",), year=2023)],
+            status=JobStatus.COMPLETED,
+        )
+
+        assert json.loads(result.to_json()) == result.to_dict()
+
     @pytest.mark.unit
     def test_literature_result_from_dict(self):
         """LiteratureResult.from_dict should reconstruct result."""
@@ -32,6 +32,20 @@ def test_get_project_id_valid(tmp_path):
     assert get_project_id(str(tmp_path)) == "abc12345"
 
 
+@pytest.mark.unit
+def test_load_project_json_caller_mutation_does_not_leak(tmp_path):
+    project = {"id": "abc12345", "files": ["a.csv"], "meta": {"n": 1}}
+    (tmp_path / "project.json").write_text(json.dumps(project))
+
+    first = load_project_json(str(tmp_path))
+    first["files"].append("b.csv")
+    first["meta"]["n"] = 2
+
+    second = load_project_json(str(tmp_path))
+    assert second["files"] == ["a.csv"]
+    assert second["meta"] == {"n": 1}
+
+
 @pytest.mark.unit
 def test_get_project_id_invalid_json(tmp_path):
     (tmp_path / "project.json").write_text("{not json")
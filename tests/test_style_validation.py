@@ -7,6 +7,7 @@ Tests banned word detection, word counting, and style enforcement.
 import pytest
 from src.utils.style_validation import (
     check_banned_words,
+    find_banned,
     count_words,
     count_words_by_section,
     estimate_page_count,
@@ -87,6 +88,28 @@ class TestBannedWordDetection:
         assert "use" in matches[0].replacements
 
 
+class TestFindBanned:
+    """Tests for the low-level banned word scanner."""
+
+    def test_returns_canonical_word_and_position(self):
+        """Matches map back to the canonical dictionary form."""
+        text = "We utilize ai-powered tools."
+        found = find_banned(text)
+
+        assert ("utilize", 3) in found
+        assert any(word == "AI-powered" for word, _ in found)
+
+    def test_enforces_word_boundaries(self):
+        """Banned words inside longer words are not matched."""
+        assert find_banned("potentiality and smartphones") == []
+
+    def test_prefers_longest_phrase(self):
+        """Multi-word phrases win over shorter contained entries."""
+        found = find_banned("A state-of-the-art method.")
+
+        assert [word for word, _ in found] == ["state-of-the-art"]
+
+
 class TestWordCounting:
     """Tests for word counting functionality."""
     
@@ -34,11 +34,12 @@ class TestTracingSetup:
         assert "localhost" in OTLP_ENDPOINT or "4318" in OTLP_ENDPOINT
     
     @pytest.mark.unit
-    @patch('src.tracing.TracerProvider')
-    @patch('src.tracing.OTLPSpanExporter')
-    @patch('src.tracing.BatchSpanProcessor')
+    # setup_tracing imports the SDK lazily, so patch the source modules.
+    @patch('opentelemetry.sdk.trace.TracerProvider')
+    @patch('opentelemetry.exporter.otlp.proto.http.trace_exporter.OTLPSpanExporter')
+    @patch('opentelemetry.sdk.trace.export.BatchSpanProcessor')
     @patch('src.tracing.trace')
-    @patch('src.tracing.HTTPXClientInstrumentor')
+    @patch('opentelemetry.instrumentation.httpx.HTTPXClientInstrumentor')
     def test_setup_tracing_creates_provider(
         self, mock_httpx, mock_trace, mock_processor, mock_exporter, mock_provider
     ):